@@ -7,6 +7,7 @@ import os
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
 
 logger = logging.getLogger("app.database")
 
@@ -22,15 +23,27 @@ def create_database_engine() -> Engine:
 
     logger.info(f"Creating database engine for: {database_url.split('@')[1] if '@' in database_url else 'localhost'}")
 
+    if os.getenv("DB_PGBOUNCER", "false").lower() == "true":
+        # PgBouncer already pools server connections; a second pool here would pin them
+        pool_settings = {"poolclass": NullPool}
+    else:
+        pool_settings = {
+            # Connection pool settings (admin pages fan out many small queries per request)
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "40")),
+            # Fail fast with a clear error instead of queueing requests behind a saturated pool
+            "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_pre_ping": True,
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            # Reuse the most recently returned connection to keep it warm
+            "pool_use_lifo": True,
+        }
+
     engine = create_engine(
         database_url,
-        # Connection pool settings
-        pool_size=10,
-        max_overflow=20,
-        pool_pre_ping=True,
-        pool_recycle=3600,
         # Echo SQL queries in development
         echo=os.getenv("DB_ECHO", "false").lower() == "true",
+        **pool_settings,
     )
 
     return engine
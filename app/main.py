@@ -10,10 +10,12 @@ from typing import Any, Dict
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.middleware.health_interceptor import HealthCheckInterceptor
 from app.routes.admin import router as admin_router
 from app.routes.auth import router as auth_router
 from app.routes.cluster import router as cluster_router
 from app.routes.course import router as course_router
+from app.routes.health import flower_client
 from app.routes.health import router as health_router
 from app.routes.home import router as home_router
 from app.routes.import_route import router as import_router
@@ -22,6 +24,8 @@ from app.routes.ml_monitoring import router as ml_monitoring_router
 from app.routes.rop import router as rop_router
 from app.routes.student import router as student_router
 from app.routes.teacher import router as teacher_router
+from app.services.auth_log_service import auth_log_service
+from app.services.rabbitmq_pool import rabbitmq_pool
 
 # Request ID context variable
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -74,6 +78,10 @@ async def add_request_id(request: Request, call_next):
     return response
 
 
+# Added last so it wraps every other middleware: /healthz probes are answered before request logging and routing
+app.add_middleware(HealthCheckInterceptor)
+
+
 # Include routers
 app.include_router(home_router, tags=["home"])
 app.include_router(health_router, tags=["health"])
@@ -88,4 +96,21 @@ app.include_router(course_router, tags=["course"])
 app.include_router(ml_monitoring_router, tags=["ml-monitoring"])
 app.include_router(cluster_router, tags=["cluster"])
 
+
+@app.on_event("shutdown")
+def flush_auth_log() -> None:
+    # Write buffered auth attempts before the process exits
+    auth_log_service.flush()
+
+
+@app.on_event("shutdown")
+def close_rabbitmq_connection() -> None:
+    rabbitmq_pool.close()
+
+
+@app.on_event("shutdown")
+async def close_flower_client() -> None:
+    await flower_client.aclose()
+
+
 # Root endpoint is now handled by home_router
@@ -0,0 +1,47 @@
+"""
+ASGI interceptor answering liveness probes before the FastAPI middleware stack.
+"""
+
+import orjson
+
+from app.routes.health import SERVICE_NAME, SERVICE_VERSION
+
+HEALTHZ_PATH = "/healthz"
+
+# Liveness probes hit /healthz constantly, so the whole response is built once
+HEALTHZ_BODY = orjson.dumps({"status": "ok", "service": SERVICE_NAME, "version": SERVICE_VERSION})
+HEALTHZ_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(HEALTHZ_BODY)).encode("latin-1")),
+]
+METHOD_NOT_ALLOWED_BODY = orjson.dumps({"detail": "Method Not Allowed"})
+METHOD_NOT_ALLOWED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(METHOD_NOT_ALLOWED_BODY)).encode("latin-1")),
+    (b"allow", b"GET"),
+]
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI middleware that short-circuits GET /healthz.
+
+    Registered as the outermost user middleware, so probes skip request logging, CORS,
+    route matching and dependency resolution. Every other request is passed through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] != HEALTHZ_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "GET":
+            status, headers, body = 200, HEALTHZ_HEADERS, HEALTHZ_BODY
+        else:
+            status, headers, body = 405, METHOD_NOT_ALLOWED_HEADERS, METHOD_NOT_ALLOWED_BODY
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
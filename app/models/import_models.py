@@ -36,7 +36,7 @@ class ImportErrorLog(SQLModel, table=True):
     __tablename__ = "import_errors"
 
     error_id: int = Field(primary_key=True)
-    job_id: str = Field(foreign_key="import_jobs.job_id")
+    job_id: str = Field(foreign_key="import_jobs.job_id", index=True)
     row_number: int = Field()
     column_name: Optional[str] = Field(default=None, max_length=100)
     error_type: str = Field(max_length=50)  # validation, parsing, database, etc.
@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index, MetaData, String, Table
 from sqlmodel import JSON, Column, Field, SQLModel, Text
 
 
@@ -13,6 +14,10 @@ class LLMRecommendation(SQLModel, table=True):
     """Cached LLM recommendations for students."""
 
     __tablename__ = "llm_recommendations"
+    __table_args__ = (
+        # Latest recommendation per student/course (backward scan serves ORDER BY created_at DESC)
+        Index("ix_llm_rec_student_course_created", "student_id", "course_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     student_id: str = Field(index=True)
@@ -25,8 +30,13 @@ class LLMRecommendation(SQLModel, table=True):
 
     def get_recommendations(self) -> List[str]:
         """Get recommendations as list."""
+        return self.parse_recommendations(self.recommendations_json)
+
+    @staticmethod
+    def parse_recommendations(recommendations_json: Optional[str]) -> List[str]:
+        """Parse a stored recommendations_json value (also used with column-only selects)."""
         try:
-            return json.loads(self.recommendations_json)
+            return json.loads(recommendations_json)
         except (json.JSONDecodeError, TypeError):
             return []
 
@@ -35,6 +45,10 @@ class LLMCallLog(SQLModel, table=True):
     """Log of LLM API calls for monitoring and debugging."""
 
     __tablename__ = "llm_call_logs"
+    __table_args__ = (
+        Index("ix_llm_course_created", "course_id", "created_at"),
+        Index("ix_llm_created_status", "created_at", "status"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     student_id: Optional[str] = Field(index=True)
@@ -60,10 +74,19 @@ class LLMCallLog(SQLModel, table=True):
     recommendations_count: Optional[int] = None
 
 
+# Materialized view with the last 24 hours of llm_call_logs, refreshed by a beat task.
+# Kept on its own MetaData so SQLModel.metadata.create_all() never creates it as a table.
+llm_call_log_24h = LLMCallLog.__table__.to_metadata(MetaData(), name="llm_call_log_24h")
+
+# Materialized view with distinct non-empty course IDs from the last 24 hours of llm_call_logs
+llm_active_courses = Table("mv_llm_active_courses", MetaData(), Column("course_id", String, nullable=False))
+
+
 class LLMFeedback(SQLModel, table=True):
     """Student and teacher feedback on LLM recommendations."""
 
     __tablename__ = "llm_feedback"
+    __table_args__ = (Index("ix_llm_feedback_rec_type", "recommendation_id", "feedback_type"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     recommendation_id: int = Field(index=True)  # Reference to LLMRecommendation
@@ -5,6 +5,7 @@ Student and course models.
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -46,6 +47,7 @@ class Lesson(SQLModel, table=True):
     """Lesson model for attendance tracking."""
 
     __tablename__ = "lessons"
+    __table_args__ = (Index("ix_lessons_course_id", "course_id"),)
 
     id: int = Field(primary_key=True)
     course_id: int = Field(foreign_key="courses.id")
@@ -63,6 +65,7 @@ class Task(SQLModel, table=True):
     """Task model for learning process tracking."""
 
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_course_id_deadline", "course_id", "deadline"),)
 
     id: int = Field(primary_key=True)
     course_id: int = Field(foreign_key="courses.id")
@@ -80,6 +83,10 @@ class Attendance(SQLModel, table=True):
     """Attendance record model."""
 
     __tablename__ = "attendances"
+    __table_args__ = (
+        # Covers attendance aggregates on course pages with index-only scans
+        Index("ix_attendances_lesson_student_attended", "lesson_id", "student_id", postgresql_include=["attended"]),
+    )
 
     id: int = Field(primary_key=True)
     student_id: str = Field(foreign_key="students.id")
@@ -98,6 +105,10 @@ class TaskCompletion(SQLModel, table=True):
     """Task completion record model."""
 
     __tablename__ = "task_completions"
+    __table_args__ = (
+        # Covers completion aggregates on course pages with index-only scans
+        Index("ix_task_completions_task_student_status", "task_id", "student_id", postgresql_include=["status"]),
+    )
 
     id: int = Field(primary_key=True)
     student_id: str = Field(foreign_key="students.id")
@@ -2,31 +2,244 @@
 Admin routes for system configuration.
 """
 
+import csv
 import logging
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse, Response
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from app.database.session import get_session
 from app.middleware.auth import require_admin
 from app.models.import_models import ImportErrorLog, ImportJob
-from app.models.llm_models import LLMCallLog, LLMFeedback, LLMRecommendation
+from app.models.llm_models import LLMFeedback, LLMRecommendation, llm_active_courses, llm_call_log_24h
 from app.models.student import Attendance, Course, Student, Task, TaskCompletion
 from app.models.user import Role, User, UserCourseAssignment, UserRole
 from app.services.config_service import config_service
-from app.services.rbac_service import RBACService
+from app.services.etag_service import compute_etag, etag_matches, not_modified_response
+from app.ui.templating import templates
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 logger = logging.getLogger("app.admin")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
-rbac_service = RBACService()
+
+def _error_page(message: str, url: str) -> bytes:
+    """Static error page that redirects back after 3 seconds, encoded once at import."""
+    return f"""
+<html>
+    <head>
+        <meta http-equiv="refresh" content="3; url={url}">
+        <title>Ошибка</title>
+    </head>
+    <body>
+        <p>{message} Перенаправление...</p>
+        <script>window.location.href = '{url}';</script>
+    </body>
+</html>
+""".encode("utf-8")
+
+
+# Prebuilt error pages, exception details are logged instead of shown
+USER_EXISTS_HTML = _error_page("Пользователь с таким ID, логином или email уже существует.", "/admin/users")
+USER_ADD_ERROR_HTML = _error_page("Ошибка при добавлении пользователя.", "/admin/users")
+ROLE_EXISTS_HTML = _error_page("Роль уже назначена пользователю.", "/admin/staff")
+ROLE_ASSIGN_ERROR_HTML = _error_page("Ошибка при назначении роли.", "/admin/staff")
+STUDENT_NOT_FOUND_HTML = _error_page("Студент не найден.", "/admin/students")
+STUDENT_EDIT_ERROR_HTML = _error_page("Ошибка при обновлении студента.", "/admin/students")
+ASSIGNMENT_EXISTS_HTML = _error_page("Назначение уже существует.", "/admin/course-assignments")
+ASSIGNMENT_ERROR_HTML = _error_page("Ошибка при назначении курса.", "/admin/course-assignments")
+
+# Settings shown on /admin/settings with their defaults
+ADMIN_SETTING_DEFAULTS = {
+    "APP_NOW_MODE": "real",
+    "APP_FAKE_NOW": "",
+    "LLM_MAX_RECS": "3",
+    "LLM_REC_MAX_CHARS": "200",
+    "LLM_TIMEOUT_SECONDS": "10",
+    "LLM_CACHE_TTL_HOURS": "24",
+    # LLM Monitoring settings
+    "LLM_MONITORING_ENABLED": "true",
+    "LLM_ALERT_ERROR_RATE_PCT": "10.0",
+    "LLM_ALERT_CONSECUTIVE_FAILS": "5",
+    "LLM_ALERT_EMAIL_TO": "",
+    "LLM_LOG_RETENTION_DAYS": "30",
+}
+
+# Roles listed on the staff and course assignment pages
+STAFF_ROLES = ["teacher", "rop", "data_operator"]
+
+# Window covered by the LLM monitoring page and CSV export
+LLM_MONITORING_WINDOW = timedelta(hours=24)
+
+# LLM CSV export layout
+LLM_CSV_HEADER = (
+    "Время",
+    "Студент ID",
+    "Курс ID",
+    "Статус",
+    "Время ответа (мс)",
+    "Количество рекомендаций",
+    "Модель",
+    "Температура",
+    "Макс токены",
+    "Количество повторов",
+    "Сообщение об ошибке",
+    "Превью ответа",
+)
+# Exported columns in header order, shaped in SQL so rows go to csv.writer as-is
+# (csv.writer writes NULL as an empty cell, NULLIF keeps zero values blank as before)
+_llm_csv_calls = llm_call_log_24h.c
+LLM_CSV_COLUMNS = (
+    func.to_char(_llm_csv_calls.created_at, "YYYY-MM-DD HH24:MI:SS").label("created_at"),
+    _llm_csv_calls.student_id,
+    _llm_csv_calls.course_id,
+    _llm_csv_calls.status,
+    func.nullif(_llm_csv_calls.response_time_ms, 0).label("response_time_ms"),
+    func.nullif(_llm_csv_calls.recommendations_count, 0).label("recommendations_count"),
+    _llm_csv_calls.model_used,
+    func.nullif(_llm_csv_calls.temperature, 0).label("temperature"),
+    func.nullif(_llm_csv_calls.max_tokens, 0).label("max_tokens"),
+    _llm_csv_calls.retry_count,
+    _llm_csv_calls.error_message,
+    _llm_csv_calls.response_preview,
+)
+# Rows fetched per round-trip from the server-side cursor
+LLM_CSV_BATCH_SIZE = 1000
+
+
+def _llm_window_start() -> Any:
+    """
+    Start of the LLM monitoring window (UTC), computed by the database.
+
+    Keeping the cutoff in SQL instead of a bind parameter lets Postgres use
+    the same plan for every request.
+    """
+    return func.timezone("utc", func.now()) - LLM_MONITORING_WINDOW
+
+
+def _role_names() -> Any:
+    """ARRAY_AGG of role names per grouped user, NULL when the user has no roles."""
+    return func.array_agg(Role.name).filter(Role.name.isnot(None)).label("roles")
+
+
+def _staff_user_ids(role_names: List[str]) -> Any:
+    """Subquery of user IDs holding any of the given roles."""
+    return select(UserRole.user_id).join(Role, Role.role_id == UserRole.role_id).where(Role.name.in_(role_names))
+
+
+def _probe_etag(db: Session, probe: Any, *params: Any) -> str:
+    """ETag from a single-row probe query plus the request parameters that shape the page."""
+    return compute_etag([list(db.execute(probe).one()), *params])
+
+
+def _count(db: Session, model: Any, *criteria: Any) -> int:
+    """
+    Count rows of a model with a Core SELECT COUNT(*).
+
+    Core statements are served from SQLAlchemy's compiled cache on repeated
+    calls, unlike ``db.query(Model).count()`` which wraps a subquery each time.
+    """
+    stmt = select(func.count()).select_from(model)
+    if criteria:
+        stmt = stmt.where(*criteria)
+    return db.execute(stmt).scalar() or 0
+
+
+def _count_subquery(model: Any) -> Any:
+    """Scalar COUNT(*) subquery for combining several counters in one SELECT."""
+    return select(func.count()).select_from(model).scalar_subquery()
+
+
+# Repeat refreshes of polled admin pages revalidate against a cheap probe query
+ADMIN_CACHE_CONTROL = "private, max-age=10, must-revalidate"
+
+# Changes whenever an import job is created, started or finished
+IMPORT_JOBS_PROBE = select(
+    func.count(),
+    func.max(ImportJob.created_at),
+    func.max(ImportJob.started_at),
+    func.max(ImportJob.completed_at),
+).select_from(ImportJob)
+
+# Changes whenever the llm_call_log_24h view is refreshed with new or expired rows
+LLM_CALLS_PROBE = select(
+    func.count(),
+    func.min(llm_call_log_24h.c.created_at),
+    func.max(llm_call_log_24h.c.created_at),
+).select_from(llm_call_log_24h)
+
+# Dashboard counters, fetched in a single round-trip
+DASHBOARD_COUNTS = select(
+    _count_subquery(Student).label("students"),
+    _count_subquery(Course).label("courses"),
+    _count_subquery(Task).label("tasks"),
+    _count_subquery(ImportJob).label("import_jobs"),
+)
+
+# Dashboard probe: every counter the page renders plus the import job activity behind "recent imports"
+DASHBOARD_PROBE = select(
+    _count_subquery(Student),
+    _count_subquery(Course),
+    _count_subquery(Task),
+    IMPORT_JOBS_PROBE.subquery(),
+)
+
+# Import job counters as conditional aggregates over one table scan
+IMPORT_JOB_COUNTS = select(
+    func.count().label("total"),
+    func.count().filter(ImportJob.status == "completed").label("completed"),
+    func.count().filter(ImportJob.status == "failed").label("failed"),
+    func.count().filter(ImportJob.status == "pending").label("pending"),
+    func.count().filter(ImportJob.status == "processing").label("processing"),
+).select_from(ImportJob)
+
+STUDENT_COUNTS = select(
+    func.count().label("total"),
+    func.count(Student.group_id).label("with_groups"),
+).select_from(Student)
+
+ASSIGNMENT_COUNTS = select(
+    func.count().label("total"),
+    func.count().filter(UserCourseAssignment.is_active == True).label("active"),
+    func.count().filter(UserCourseAssignment.assignment_type == "teacher").label("teacher"),
+    func.count().filter(UserCourseAssignment.assignment_type == "rop").label("rop"),
+).select_from(UserCourseAssignment)
+
+
+class _CSVLine:
+    """File-like target that hands each formatted CSV line back to the caller."""
+
+    def write(self, line: str) -> str:
+        return line
+
+
+def _stream_llm_csv(result: Any) -> Iterator[str]:
+    """
+    Yield the LLM CSV export one fetched batch at a time.
+
+    Args:
+        result: Result of a LLM_CSV_COLUMNS select executed with yield_per
+
+    Returns:
+        Iterator over CSV chunks, header first
+    """
+    writer = csv.writer(_CSVLine())
+    yield writer.writerow(LLM_CSV_HEADER)
+    try:
+        for batch in result.partitions():
+            yield "".join(map(writer.writerow, batch))
+    finally:
+        result.close()
+
+
+def _llm_course_ids(db: Session) -> List[str]:
+    """Distinct non-empty course IDs seen in LLM calls during the last 24 hours."""
+    return list(db.execute(select(llm_active_courses.c.course_id).order_by(llm_active_courses.c.course_id)).scalars())
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -34,23 +247,32 @@ async def admin_dashboard(request: Request, db: Session = Depends(get_session))
     """
     Admin dashboard with system metrics and overview.
     """
-    logger.info("Admin dashboard requested")
+    logger.debug("Admin dashboard requested")
 
     try:
+        # Skip all aggregation when the operator's browser already has this state
+        etag = _probe_etag(db, DASHBOARD_PROBE)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, ADMIN_CACHE_CONTROL)
+
         # Get system metrics
+        counts = db.execute(DASHBOARD_COUNTS).one()
         metrics = {
-            "total_students": db.query(Student).count(),
-            "total_courses": db.query(Course).count(),
-            "total_tasks": db.query(Task).count(),
-            "total_import_jobs": db.query(ImportJob).count(),
+            "total_students": counts.students,
+            "total_courses": counts.courses,
+            "total_tasks": counts.tasks,
+            "total_import_jobs": counts.import_jobs,
             "recent_imports": db.query(ImportJob).order_by(ImportJob.created_at.desc()).limit(5).all(),
             "system_uptime": "N/A",  # Would be calculated in real system
-            "active_users": db.query(Student).count(),  # Simplified
+            "active_users": counts.students,  # Simplified
         }
 
-        return templates.TemplateResponse(
+        response = templates.TemplateResponse(
             "admin/dashboard.html", {"request": request, "title": "Админ-панель", "metrics": metrics}
         )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ADMIN_CACHE_CONTROL
+        return response
 
     except Exception as e:
         logger.error(f"Error loading admin dashboard: {e}")
@@ -64,23 +286,10 @@ async def admin_settings(request: Request) -> HTMLResponse:
     """
     Admin settings page for managing system configuration.
     """
-    logger.info("Admin settings page requested")
+    logger.debug("Admin settings page requested")
 
     # Get current settings
-    settings = {
-        "APP_NOW_MODE": config_service.get_setting("APP_NOW_MODE", "real"),
-        "APP_FAKE_NOW": config_service.get_setting("APP_FAKE_NOW", ""),
-        "LLM_MAX_RECS": config_service.get_setting("LLM_MAX_RECS", "3"),
-        "LLM_REC_MAX_CHARS": config_service.get_setting("LLM_REC_MAX_CHARS", "200"),
-        "LLM_TIMEOUT_SECONDS": config_service.get_setting("LLM_TIMEOUT_SECONDS", "10"),
-        "LLM_CACHE_TTL_HOURS": config_service.get_setting("LLM_CACHE_TTL_HOURS", "24"),
-        # LLM Monitoring settings
-        "LLM_MONITORING_ENABLED": config_service.get_setting("LLM_MONITORING_ENABLED", "true"),
-        "LLM_ALERT_ERROR_RATE_PCT": config_service.get_setting("LLM_ALERT_ERROR_RATE_PCT", "10.0"),
-        "LLM_ALERT_CONSECUTIVE_FAILS": config_service.get_setting("LLM_ALERT_CONSECUTIVE_FAILS", "5"),
-        "LLM_ALERT_EMAIL_TO": config_service.get_setting("LLM_ALERT_EMAIL_TO", ""),
-        "LLM_LOG_RETENTION_DAYS": config_service.get_setting("LLM_LOG_RETENTION_DAYS", "30"),
-    }
+    settings = config_service.get_settings(ADMIN_SETTING_DEFAULTS)
 
     # Get current time info
     current_time = config_service.now()
@@ -121,21 +330,7 @@ async def update_settings(
     config_service.set_setting("LLM_CACHE_TTL_HOURS", llm_cache_ttl_hours)
 
     # Redirect back to settings page
-    return HTMLResponse(
-        content=f"""
-        <html>
-            <head>
-                <meta http-equiv="refresh" content="0; url=/admin/settings">
-                <title>Настройки обновлены</title>
-            </head>
-            <body>
-                <p>Настройки обновлены. Перенаправление...</p>
-                <script>window.location.href = '/admin/settings';</script>
-            </body>
-        </html>
-        """,
-        status_code=200,
-    )
+    return RedirectResponse(url="/admin/settings", status_code=303)
 
 
 @router.get("/import-jobs", response_class=HTMLResponse)
@@ -143,25 +338,33 @@ async def admin_import_jobs(request: Request, db: Session = Depends(get_session)
     """
     Admin page for viewing import jobs and their status.
     """
-    logger.info("Admin import jobs page requested")
+    logger.debug("Admin import jobs page requested")
 
     try:
+        etag = _probe_etag(db, IMPORT_JOBS_PROBE)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, ADMIN_CACHE_CONTROL)
+
         # Get all import jobs with pagination
         import_jobs = db.query(ImportJob).order_by(ImportJob.created_at.desc()).limit(50).all()
 
         # Get import statistics
+        counts = db.execute(IMPORT_JOB_COUNTS).one()
         stats = {
-            "total_jobs": db.query(ImportJob).count(),
-            "completed_jobs": db.query(ImportJob).filter(ImportJob.status == "completed").count(),
-            "failed_jobs": db.query(ImportJob).filter(ImportJob.status == "failed").count(),
-            "pending_jobs": db.query(ImportJob).filter(ImportJob.status == "pending").count(),
-            "processing_jobs": db.query(ImportJob).filter(ImportJob.status == "processing").count(),
+            "total_jobs": counts.total,
+            "completed_jobs": counts.completed,
+            "failed_jobs": counts.failed,
+            "pending_jobs": counts.pending,
+            "processing_jobs": counts.processing,
         }
 
-        return templates.TemplateResponse(
+        response = templates.TemplateResponse(
             "admin/import_jobs.html",
             {"request": request, "title": "Журнал импорта", "import_jobs": import_jobs, "stats": stats},
         )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ADMIN_CACHE_CONTROL
+        return response
 
     except Exception as e:
         logger.error(f"Error loading import jobs: {e}")
@@ -175,17 +378,22 @@ async def admin_users(request: Request, db: Session = Depends(get_session)) -> H
     """
     Admin page for managing users and roles.
     """
-    logger.info("Admin users page requested")
+    logger.debug("Admin users page requested")
 
     try:
-        # Get all users with their roles
-        users = db.query(User).all()
+        # Get all users with their role names aggregated by Postgres, one row per user
+        user_rows = (
+            db.query(User, _role_names())
+            .outerjoin(UserRole, UserRole.user_id == User.user_id)
+            .outerjoin(Role, Role.role_id == UserRole.role_id)
+            .group_by(User.user_id)
+            .all()
+        )
         roles = db.query(Role).all()
 
         # Get user role mappings
-        user_roles = {}
-        for user in users:
-            user_roles[user.user_id] = rbac_service.get_user_roles(user.user_id, db)
+        users = [user for user, _ in user_rows]
+        user_roles = {user.user_id: user_role_names or [] for user, user_role_names in user_rows}
 
         return templates.TemplateResponse(
             "admin/users.html",
@@ -217,71 +425,72 @@ async def admin_llm_monitoring(
     """
     LLM monitoring dashboard with call logs and statistics.
     """
-    logger.info("LLM monitoring dashboard requested")
+    logger.debug("LLM monitoring dashboard requested")
 
     try:
-        # Get LLM statistics for last 24 hours
-        from datetime import datetime, timedelta
-
-        last_24h = datetime.utcnow() - timedelta(hours=24)
-
-        # Total calls
-        total_calls = db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h).count()
-
-        # Successful calls
-        successful_calls = (
-            db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h, LLMCallLog.status == "success").count()
-        )
-
-        # Failed calls
-        failed_calls = (
-            db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h, LLMCallLog.status.in_(["failed", "error"])).count()
-        )
-
-        # Calculate success rate
+        # Skip all aggregation when the operator's browser already has this state
+        etag = _probe_etag(db, LLM_CALLS_PROBE, status, course_id, page, per_page)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, ADMIN_CACHE_CONTROL)
+
+        # Get LLM statistics for last 24 hours from the pre-aggregated view
+        calls = llm_call_log_24h.c
+        in_window = calls.created_at >= _llm_window_start()
+
+        # All summary counters in one pass over the window
+        summary = db.execute(
+            select(
+                func.count().label("total"),
+                func.count().filter(calls.status == "success").label("successful"),
+                func.count().filter(calls.status.in_(["failed", "error"])).label("failed"),
+                func.count().filter(calls.status == "cached").label("cached"),
+                func.avg(calls.response_time_ms).label("avg_response_time"),
+            )
+            .select_from(llm_call_log_24h)
+            .where(in_window)
+        ).one()
+        total_calls = summary.total
+        successful_calls = summary.successful
+        failed_calls = summary.failed
+        cached_calls = summary.cached
+
+        # Calculate success and cache hit rates
         success_rate = (successful_calls / total_calls * 100) if total_calls > 0 else 0
-
-        # Average response time
-        avg_response_time = (
-            db.query(LLMCallLog)
-            .filter(LLMCallLog.created_at >= last_24h, LLMCallLog.response_time_ms.isnot(None))
-            .with_entities(func.avg(LLMCallLog.response_time_ms))
-            .scalar()
-            or 0
-        )
-
-        # Cache hit rate
-        cached_calls = db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h, LLMCallLog.status == "cached").count()
-
         cache_hit_rate = (cached_calls / total_calls * 100) if total_calls > 0 else 0
 
-        # Build query for call logs
-        query = db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h)
+        # Average response time (AVG skips NULL response times)
+        avg_response_time = float(summary.avg_response_time or 0)
 
-        # Apply filters
+        # Build filters for call logs
+        criteria = [in_window]
         if status:
-            query = query.filter(LLMCallLog.status == status)
+            criteria.append(calls.status == status)
         if course_id:
-            query = query.filter(LLMCallLog.course_id == course_id)
+            criteria.append(calls.course_id == course_id)
 
-        # Get total count for pagination
-        total_logs = query.count()
-
-        # Apply pagination
+        # Apply pagination, COUNT(*) OVER() returns the total with the page rows
         offset = (page - 1) * per_page
-        call_logs = query.order_by(LLMCallLog.created_at.desc()).offset(offset).limit(per_page).all()
+        call_logs = db.execute(
+            select(llm_call_log_24h, func.count().over().label("total_count"))
+            .where(*criteria)
+            .order_by(calls.created_at.desc())
+            .offset(offset)
+            .limit(per_page)
+        ).all()
+
+        # Get total count for pagination, a separate count is only needed past the last page
+        if call_logs:
+            total_logs = call_logs[0].total_count
+        elif offset:
+            total_logs = _count(db, llm_call_log_24h, *criteria)
+        else:
+            total_logs = 0
 
         # Calculate total pages
         total_pages = (total_logs + per_page - 1) // per_page
 
         # Get unique courses for filter dropdown
-        courses = (
-            db.query(LLMCallLog.course_id)
-            .filter(LLMCallLog.course_id.isnot(None), LLMCallLog.created_at >= last_24h)
-            .distinct()
-            .all()
-        )
-        course_list = [course[0] for course in courses if course[0]]
+        course_list = _llm_course_ids(db)
 
         # Statistics summary
         stats = {
@@ -294,7 +503,7 @@ async def admin_llm_monitoring(
             "cached_calls": cached_calls,
         }
 
-        return templates.TemplateResponse(
+        response = templates.TemplateResponse(
             "admin/llm_monitoring.html",
             {
                 "request": request,
@@ -309,6 +518,9 @@ async def admin_llm_monitoring(
                 "filters": {"status": status, "course_id": course_id},
             },
         )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ADMIN_CACHE_CONTROL
+        return response
 
     except Exception as e:
         logger.error(f"Error loading LLM monitoring: {e}")
@@ -325,76 +537,34 @@ async def admin_llm_export_csv(status: str = None, course_id: str = None, db: Se
     logger.info("LLM CSV export requested")
 
     try:
-        import csv
-        import io
-        from datetime import datetime, timedelta
-
-        # Get data for last 24 hours
-        last_24h = datetime.utcnow() - timedelta(hours=24)
-
-        # Build query
-        query = db.query(LLMCallLog).filter(LLMCallLog.created_at >= last_24h)
+        # Get data for last 24 hours from the pre-aggregated view
+        calls = llm_call_log_24h.c
+        criteria = [calls.created_at >= _llm_window_start()]
 
         # Apply filters
         if status:
-            query = query.filter(LLMCallLog.status == status)
+            criteria.append(calls.status == status)
         if course_id:
-            query = query.filter(LLMCallLog.course_id == course_id)
-
-        # Get all matching records
-        call_logs = query.order_by(LLMCallLog.created_at.desc()).all()
-
-        # Create CSV content
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "Время",
-                "Студент ID",
-                "Курс ID",
-                "Статус",
-                "Время ответа (мс)",
-                "Количество рекомендаций",
-                "Модель",
-                "Температура",
-                "Макс токены",
-                "Количество повторов",
-                "Сообщение об ошибке",
-                "Превью ответа",
-            ]
+            criteria.append(calls.course_id == course_id)
+
+        # Stream matching records from a server-side cursor
+        stmt = (
+            select(*LLM_CSV_COLUMNS)
+            .where(*criteria)
+            .order_by(calls.created_at.desc())
+            .execution_options(yield_per=LLM_CSV_BATCH_SIZE)
         )
-
-        # Write data rows
-        for log in call_logs:
-            writer.writerow(
-                [
-                    log.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    log.student_id or "",
-                    log.course_id or "",
-                    log.status,
-                    log.response_time_ms or "",
-                    log.recommendations_count or "",
-                    log.model_used or "",
-                    log.temperature or "",
-                    log.max_tokens or "",
-                    log.retry_count,
-                    log.error_message or "",
-                    log.response_preview or "",
-                ]
-            )
-
-        # Get CSV content
-        csv_content = output.getvalue()
-        output.close()
+        # Session stays open until the stream is consumed: dependency teardown runs after the response is sent
+        result = db.execute(stmt)
 
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"llm_logs_{timestamp}.csv"
 
-        return Response(
-            content=csv_content, media_type="text/csv", headers={"Content-Disposition": f"attachment; filename={filename}"}
+        return StreamingResponse(
+            _stream_llm_csv(result),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
     except Exception as e:
@@ -418,71 +588,25 @@ async def add_user(
     logger.info(f"Adding new user: {user_id}")
 
     try:
-        # Check if user already exists
-        existing_user = (
-            db.query(User).filter((User.user_id == user_id) | (User.login == login) | (User.email == email)).first()
-        )
-
-        if existing_user:
-            return HTMLResponse(
-                content=f"""
-                <html>
-                    <head>
-                        <meta http-equiv="refresh" content="3; url=/admin/users">
-                        <title>Ошибка</title>
-                    </head>
-                    <body>
-                        <p>Пользователь с таким ID, логином или email уже существует. Перенаправление...</p>
-                        <script>window.location.href = '/admin/users';</script>
-                    </body>
-                </html>
-                """,
-                status_code=400,
-            )
-
-        # Create new user
+        # Create new user, duplicates are rejected by the user_id/login/email constraints
         new_user = User(user_id=user_id, login=login, email=email, display_name=display_name, is_active=is_active)
 
         db.add(new_user)
-        db.commit()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return HTMLResponse(content=USER_EXISTS_HTML, status_code=400)
 
         logger.info(f"User {user_id} created successfully")
 
         # Redirect back to users page
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="0; url=/admin/users">
-                    <title>Пользователь добавлен</title>
-                </head>
-                <body>
-                    <p>Пользователь успешно добавлен. Перенаправление...</p>
-                    <script>window.location.href = '/admin/users';</script>
-                </body>
-            </html>
-            """,
-            status_code=200,
-        )
+        return RedirectResponse(url="/admin/users", status_code=303)
 
     except Exception as e:
         logger.error(f"Error adding user: {e}")
         db.rollback()
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="3; url=/admin/users">
-                    <title>Ошибка</title>
-                </head>
-                <body>
-                    <p>Ошибка при добавлении пользователя: {str(e)}. Перенаправление...</p>
-                    <script>window.location.href = '/admin/users';</script>
-                </body>
-            </html>
-            """,
-            status_code=500,
-        )
+        return HTMLResponse(content=USER_ADD_ERROR_HTML, status_code=500)
 
 
 @router.get("/staff", response_class=HTMLResponse)
@@ -490,23 +614,27 @@ async def admin_staff(request: Request, db: Session = Depends(get_session)) -> H
     """
     Admin page for managing staff (teachers, ROPs, data operators).
     """
-    logger.info("Admin staff page requested")
+    logger.debug("Admin staff page requested")
 
     try:
         # Get all users with staff roles
-        staff_roles = ["teacher", "rop", "data_operator"]
-        staff_users = []
-
-        for user in db.query(User).all():
-            user_roles = rbac_service.get_user_roles(user.user_id, db)
-            if any(role in staff_roles for role in user_roles):
-                staff_users.append(
-                    {
-                        "user": user,
-                        "roles": user_roles,
-                        "primary_role": next((role for role in user_roles if role in staff_roles), None),
-                    }
-                )
+        staff_roles = STAFF_ROLES
+
+        # One row per staff user with all role names aggregated, only the columns the page shows
+        staff_rows = (
+            db.query(User, _role_names())
+            .options(load_only(User.user_id, User.login, User.email, User.display_name, User.is_active, User.created_at))
+            .join(UserRole, UserRole.user_id == User.user_id)
+            .join(Role, Role.role_id == UserRole.role_id)
+            .filter(User.user_id.in_(_staff_user_ids(staff_roles)))
+            .group_by(User.user_id)
+            .all()
+        )
+
+        staff_users = [
+            {"user": user, "roles": roles, "primary_role": next(role for role in roles if role in staff_roles)}
+            for user, roles in staff_rows
+        ]
 
         # Get all available roles
         roles = db.query(Role).all()
@@ -543,68 +671,27 @@ async def assign_staff_role(
     logger.info(f"Assigning role {role_id} to user {user_id}")
 
     try:
-        # Check if assignment already exists
-        existing = db.query(UserRole).filter(UserRole.user_id == user_id, UserRole.role_id == role_id).first()
-
-        if existing:
-            return HTMLResponse(
-                content=f"""
-                <html>
-                    <head>
-                        <meta http-equiv="refresh" content="3; url=/admin/staff">
-                        <title>Ошибка</title>
-                    </head>
-                    <body>
-                        <p>Роль уже назначена пользователю. Перенаправление...</p>
-                        <script>window.location.href = '/admin/staff';</script>
-                    </body>
-                </html>
-                """,
-                status_code=400,
-            )
-
-        # Create new role assignment
-        user_role = UserRole(user_id=user_id, role_id=role_id, assigned_by="admin")  # TODO: Get from session
-
-        db.add(user_role)
+        # Create new role assignment, an existing (user_id, role_id) pair inserts nothing
+        stmt = (
+            pg_insert(UserRole)
+            # TODO: Get assigned_by from session
+            .values(user_id=user_id, role_id=role_id, assigned_at=datetime.utcnow(), assigned_by="admin")
+            .on_conflict_do_nothing(index_elements=[UserRole.user_id, UserRole.role_id])
+        )
+        result = db.execute(stmt)
         db.commit()
 
+        if result.rowcount == 0:
+            return HTMLResponse(content=ROLE_EXISTS_HTML, status_code=400)
+
         logger.info(f"Role {role_id} assigned to user {user_id} successfully")
 
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="0; url=/admin/staff">
-                    <title>Роль назначена</title>
-                </head>
-                <body>
-                    <p>Роль успешно назначена. Перенаправление...</p>
-                    <script>window.location.href = '/admin/staff';</script>
-                </body>
-            </html>
-            """,
-            status_code=200,
-        )
+        return RedirectResponse(url="/admin/staff", status_code=303)
 
     except Exception as e:
         logger.error(f"Error assigning role: {e}")
         db.rollback()
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="3; url=/admin/staff">
-                    <title>Ошибка</title>
-                </head>
-                <body>
-                    <p>Ошибка при назначении роли: {str(e)}. Перенаправление...</p>
-                    <script>window.location.href = '/admin/staff';</script>
-                </body>
-            </html>
-            """,
-            status_code=500,
-        )
+        return HTMLResponse(content=ROLE_ASSIGN_ERROR_HTML, status_code=500)
 
 
 @router.get("/students", response_class=HTMLResponse)
@@ -619,7 +706,7 @@ async def admin_students(
     """
     Admin page for managing students.
     """
-    logger.info("Admin students page requested")
+    logger.debug("Admin students page requested")
 
     try:
         # Build query for students
@@ -652,11 +739,12 @@ async def admin_students(
         courses = db.query(Course).all()
 
         # Get statistics
+        counts = db.execute(STUDENT_COUNTS).one()
         stats = {
-            "total_students": db.query(Student).count(),
-            "students_with_groups": db.query(Student).filter(Student.group_id.isnot(None)).count(),
-            "students_without_groups": db.query(Student).filter(Student.group_id.is_(None)).count(),
-            "active_students": db.query(Student).count(),  # Simplified - all students are considered active
+            "total_students": counts.total,
+            "students_with_groups": counts.with_groups,
+            "students_without_groups": counts.total - counts.with_groups,
+            "active_students": counts.total,  # Simplified - all students are considered active
         }
 
         return templates.TemplateResponse(
@@ -701,21 +789,7 @@ async def edit_student(
         # Find student
         student = db.query(Student).filter(Student.id == student_id).first()
         if not student:
-            return HTMLResponse(
-                content=f"""
-                <html>
-                    <head>
-                        <meta http-equiv="refresh" content="3; url=/admin/students">
-                        <title>Ошибка</title>
-                    </head>
-                    <body>
-                        <p>Студент не найден. Перенаправление...</p>
-                        <script>window.location.href = '/admin/students';</script>
-                    </body>
-                </html>
-                """,
-                status_code=404,
-            )
+            return HTMLResponse(content=STUDENT_NOT_FOUND_HTML, status_code=404)
 
         # Update student data
         if name is not None:
@@ -731,40 +805,12 @@ async def edit_student(
 
         logger.info(f"Student {student_id} updated successfully")
 
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="0; url=/admin/students">
-                    <title>Студент обновлен</title>
-                </head>
-                <body>
-                    <p>Информация о студенте успешно обновлена. Перенаправление...</p>
-                    <script>window.location.href = '/admin/students';</script>
-                </body>
-            </html>
-            """,
-            status_code=200,
-        )
+        return RedirectResponse(url="/admin/students", status_code=303)
 
     except Exception as e:
         logger.error(f"Error editing student: {e}")
         db.rollback()
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="3; url=/admin/students">
-                    <title>Ошибка</title>
-                </head>
-                <body>
-                    <p>Ошибка при обновлении студента: {str(e)}. Перенаправление...</p>
-                    <script>window.location.href = '/admin/students';</script>
-                </body>
-            </html>
-            """,
-            status_code=500,
-        )
+        return HTMLResponse(content=STUDENT_EDIT_ERROR_HTML, status_code=500)
 
 
 @router.get("/course-assignments", response_class=HTMLResponse)
@@ -774,7 +820,7 @@ async def admin_course_assignments(
     """
     Admin page for managing course assignments to staff.
     """
-    logger.info("Admin course assignments page requested")
+    logger.debug("Admin course assignments page requested")
 
     try:
         # Get all course assignments
@@ -789,23 +835,18 @@ async def admin_course_assignments(
         assignments = query.order_by(UserCourseAssignment.assigned_at.desc()).all()
 
         # Get all users with staff roles for dropdown
-        staff_users = []
-        for user in db.query(User).all():
-            user_roles = rbac_service.get_user_roles(user.user_id, db)
-            if any(role in ["teacher", "rop", "data_operator"] for role in user_roles):
-                staff_users.append(user)
+        staff_users = db.query(User).filter(User.user_id.in_(_staff_user_ids(STAFF_ROLES))).all()
 
         # Get all courses
         courses = db.query(Course).all()
 
         # Get statistics
+        counts = db.execute(ASSIGNMENT_COUNTS).one()
         stats = {
-            "total_assignments": db.query(UserCourseAssignment).count(),
-            "active_assignments": db.query(UserCourseAssignment).filter(UserCourseAssignment.is_active == True).count(),
-            "teacher_assignments": db.query(UserCourseAssignment)
-            .filter(UserCourseAssignment.assignment_type == "teacher")
-            .count(),
-            "rop_assignments": db.query(UserCourseAssignment).filter(UserCourseAssignment.assignment_type == "rop").count(),
+            "total_assignments": counts.total,
+            "active_assignments": counts.active,
+            "teacher_assignments": counts.teacher,
+            "rop_assignments": counts.rop,
         }
 
         return templates.TemplateResponse(
@@ -855,21 +896,7 @@ async def assign_course_to_user(
         )
 
         if existing:
-            return HTMLResponse(
-                content=f"""
-                <html>
-                    <head>
-                        <meta http-equiv="refresh" content="3; url=/admin/course-assignments">
-                        <title>Ошибка</title>
-                    </head>
-                    <body>
-                        <p>Назначение уже существует. Перенаправление...</p>
-                        <script>window.location.href = /admin/course-assignments;</script>
-                    </body>
-                </html>
-                """,
-                status_code=400,
-            )
+            return HTMLResponse(content=ASSIGNMENT_EXISTS_HTML, status_code=400)
 
         # Create new assignment
         assignment = UserCourseAssignment(
@@ -884,40 +911,12 @@ async def assign_course_to_user(
 
         logger.info(f"Course {course_id} assigned to user {user_id} successfully")
 
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="0; url=/admin/course-assignments">
-                    <title>Курс назначен</title>
-                </head>
-                <body>
-                    <p>Курс успешно назначен. Перенаправление...</p>
-                    <script>window.location.href = /admin/course-assignments;</script>
-                </body>
-            </html>
-            """,
-            status_code=200,
-        )
+        return RedirectResponse(url="/admin/course-assignments", status_code=303)
 
     except Exception as e:
         logger.error(f"Error assigning course: {e}")
         db.rollback()
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <head>
-                    <meta http-equiv="refresh" content="3; url=/admin/course-assignments">
-                    <title>Ошибка</title>
-                </head>
-                <body>
-                    <p>Ошибка при назначении курса: {str(e)}. Перенаправление...</p>
-                    <script>window.location.href = /admin/course-assignments;</script>
-                </body>
-            </html>
-            """,
-            status_code=500,
-        )
+        return HTMLResponse(content=ASSIGNMENT_ERROR_HTML, status_code=500)
 
 
 @router.get("/courses", response_class=HTMLResponse)
@@ -932,7 +931,7 @@ async def admin_courses(request: Request, db: Session = Depends(get_session)) ->
     Returns:
         HTML response with admin courses
     """
-    logger.info("Admin courses page requested")
+    logger.debug("Admin courses page requested")
 
     try:
         # Mock courses data
@@ -993,7 +992,7 @@ async def admin_ml_monitoring(request: Request) -> HTMLResponse:
     Returns:
         HTML response with ML monitoring dashboard
     """
-    logger.info("Admin ML monitoring page requested")
+    logger.debug("Admin ML monitoring page requested")
 
     return templates.TemplateResponse("admin/ml_monitoring.html", {"request": request, "title": "Мониторинг ML-кластеризации"})
 
@@ -1010,7 +1009,7 @@ async def admin_settings(request: Request, db: Session = Depends(get_session)) -
     Returns:
         HTML response with admin settings
     """
-    logger.info("Admin settings page requested")
+    logger.debug("Admin settings page requested")
 
     try:
         # Mock settings data
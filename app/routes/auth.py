@@ -3,77 +3,85 @@ Authentication routes.
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
-from app.models.user import Role, User, UserAuthLog, UserRole
+from app.models.user import User
+from app.services.auth_log_service import auth_log_service
+from app.services.cache_service import TTLCache
 from app.services.session_service import session_service
-from worker.auth_tasks import (
-    assign_default_role_task,
-    create_user_session_task,
-    destroy_user_session_task,
-    log_auth_attempt_task,
-)
+from app.ui.templating import templates
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 logger = logging.getLogger("app.auth")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
+DEFAULT_ROLE = "student"
+
+# Messages for ?error= codes the login form is redirected back with
+LOGIN_ERRORS = {"empty": "Введите логин и пароль"}
+
+# Rendered login page bytes per error code
+login_pages: Dict[str, bytes] = {}
+
+# login -> user_id, so repeat logins load the user by primary key
+LOGIN_CACHE_TTL_SECONDS = 300
+login_user_id_cache = TTLCache(ttl_seconds=LOGIN_CACHE_TTL_SECONDS, max_entries=10000)
+
+# GET /auth/verify is a legacy entry point; a header-only redirect that browsers may cache
+AUTH_FORM_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# Insert the user if the login is new and give a freshly inserted user the default role
+CREATE_USER_SQL = text(
+    """
+    WITH new_user AS (
+        INSERT INTO users (user_id, email, login, display_name, is_active, created_at, updated_at)
+        VALUES (:user_id, :email, :login, :display_name, true, :now, :now)
+        ON CONFLICT (login) DO UPDATE SET login = EXCLUDED.login
+        RETURNING users.*, (xmax = 0) AS inserted
+    ),
+    new_role AS (
+        INSERT INTO user_roles (user_id, role_id, assigned_at)
+        SELECT new_user.user_id, roles.role_id, :now
+        FROM new_user JOIN roles ON roles.name = :default_role
+        WHERE new_user.inserted
+        ON CONFLICT DO NOTHING
+    )
+    SELECT user_id, email, login, display_name, is_active, created_at, updated_at FROM new_user
+    """
+)
 
 
 def log_auth_attempt(
-    db: Session, login: str, outcome: str, request: Request, user_id: Optional[str] = None, reason: Optional[str] = None
+    login: str, outcome: str, request: Request, user_id: Optional[str] = None, reason: Optional[str] = None
 ) -> None:
     """
-    Log authentication attempt for audit using Celery worker.
+    Log authentication attempt for audit.
+
+    The entry is buffered and written in batches off the request path.
 
     Args:
-        db: Database session
         login: User login
         outcome: 'success' or 'fail'
         request: FastAPI request object
         user_id: User ID if successful
         reason: Failure reason if failed
     """
-    try:
-        # Send task to auth worker
-        log_auth_attempt_task.delay(
-            login=login,
-            outcome=outcome,
-            ip_address=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent"),
-            user_id=user_id,
-            reason=reason,
-        )
-        logger.info(f"Auth log task queued: {login} - {outcome}")
-    except Exception as e:
-        logger.error(f"Failed to queue auth log task: {e}")
-        # Fallback to direct logging if worker is unavailable
-        try:
-            auth_log = UserAuthLog(
-                login=login,
-                outcome=outcome,
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-                reason=reason,
-                user_id=user_id,
-            )
-            db.add(auth_log)
-            db.commit()
-            logger.info(f"Auth log recorded directly: {login} - {outcome}")
-        except Exception as fallback_e:
-            logger.error(f"Failed to log auth attempt directly: {fallback_e}")
-            try:
-                db.rollback()
-            except:
-                pass
+    auth_log_service.record(
+        login=login,
+        outcome=outcome,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent"),
+        user_id=user_id,
+        reason=reason,
+    )
+    logger.info(f"Auth attempt queued for audit log: {login} - {outcome}")
 
 
 def get_or_create_user(db: Session, login: str, email: Optional[str] = None) -> User:
@@ -88,41 +96,61 @@ def get_or_create_user(db: Session, login: str, email: Optional[str] = None) ->
     Returns:
         User object
     """
-    # Try to find existing user
-    user = db.query(User).filter(User.login == login).first()
+    # Try to find existing user, by primary key when the login was seen recently
+    user = None
+    user_id = login_user_id_cache.get(login)
+    if user_id is not None:
+        user = db.get(User, user_id)
+    if user is None or user.login != login:
+        user = db.query(User).filter(User.login == login).first()
 
     if not user:
-        # Create new user
-        user_id = f"user_{login}_{int(datetime.utcnow().timestamp())}"
-        email = email or f"{login}@pulseedu.local"
-
-        user = User(user_id=user_id, login=login, email=email, display_name=login, is_active=True)
-        db.add(user)
+        # Create user and default role in one statement, a concurrent login for the same user just returns its row
+        now = datetime.utcnow()
+        user = db.execute(
+            select(User).from_statement(CREATE_USER_SQL),
+            {
+                "user_id": f"user_{login}_{int(time.time())}",
+                "email": email or f"{login}@pulseedu.local",
+                "login": login,
+                "display_name": login,
+                "now": now,
+                "default_role": DEFAULT_ROLE,
+            },
+        ).scalar_one()
         db.commit()
-        db.refresh(user)
-
-        # Assign default role (student) using worker
-        try:
-            assign_default_role_task.delay(user.user_id, "student")
-            logger.info(f"Default role assignment queued for user {login}")
-        except Exception as e:
-            logger.error(f"Failed to queue role assignment: {e}")
-            # Fallback to direct assignment
-            default_role = db.query(Role).filter(Role.role_name == "student").first()
-            if default_role:
-                user_role = UserRole(user_id=user.user_id, role_id=default_role.role_id)
-                db.add(user_role)
-                db.commit()
-                logger.info(f"Default role assigned directly to user {login}")
 
         logger.info(f"Created new user: {login}")
 
+    login_user_id_cache.set(login, user.user_id)
     return user
 
 
+def render_login_page(error_code: str) -> bytes:
+    """
+    Render the login page, reusing the rendered bytes for each error code.
+
+    The page does not depend on the request, so it is rendered once per known error code
+    unless templates are being auto-reloaded for live editing.
+
+    Args:
+        error_code: Key from LOGIN_ERRORS or empty string
+
+    Returns:
+        Rendered HTML page
+    """
+    page = login_pages.get(error_code)
+    if page is None:
+        template = templates.get_template("auth/login.html")
+        page = template.render(title="Вход в систему", error=LOGIN_ERRORS.get(error_code)).encode("utf-8")
+        if not templates.env.auto_reload:
+            login_pages[error_code] = page
+    return page
+
+
 @router.post("/verify")
-async def verify_auth(
-    request: Request, login: str = Form(...), password: str = Form(...), db: Session = Depends(get_session)
+def verify_auth(
+    request: Request, login: str = Form(""), password: str = Form(""), db: Session = Depends(get_session)
 ) -> RedirectResponse:
     """
     Verify authentication (fake implementation).
@@ -130,19 +158,20 @@ async def verify_auth(
     Accepts any login and password combination.
     Creates user if doesn't exist.
     """
+    # Empty credentials go straight back to the form without touching the database
+    if not login or not password:
+        log_auth_attempt(login, "fail", request, reason="empty_credentials")
+        return RedirectResponse(url="/auth/login?error=empty", status_code=303)
+
     logger.info(f"Auth attempt for login: {login}")
 
     try:
         # Fake authentication - accept any login/password
-        if not login or not password:
-            log_auth_attempt(db, login, "fail", request, reason="empty_credentials")
-            raise HTTPException(status_code=400, detail="Login and password required")
-
         # Get or create user
         user = get_or_create_user(db, login)
 
         # Log successful authentication
-        log_auth_attempt(db, login, "success", request, user_id=user.user_id)
+        log_auth_attempt(login, "success", request, user_id=user.user_id)
 
         # Create session
         session_token = session_service.create_session(user)
@@ -164,7 +193,7 @@ async def verify_auth(
         raise
     except Exception as e:
         logger.error(f"Auth error for {login}: {e}")
-        log_auth_attempt(db, login, "fail", request, reason="system_error")
+        log_auth_attempt(login, "fail", request, reason="system_error")
         raise HTTPException(status_code=500, detail="Authentication failed")
 
 
@@ -173,27 +202,16 @@ async def login_page(request: Request) -> HTMLResponse:
     """
     Beautiful login page.
     """
-    return templates.TemplateResponse("auth/login.html", {"request": request, "title": "Вход в систему"})
+    error_code = request.query_params.get("error", "")
+    return HTMLResponse(content=render_login_page(error_code if error_code in LOGIN_ERRORS else ""))
 
 
 @router.get("/verify")
-async def auth_form() -> str:
+async def auth_form() -> RedirectResponse:
     """
     Simple authentication form (for testing) - redirect to new login page.
     """
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>PulseEdu - Авторизация</title>
-        <meta http-equiv="refresh" content="0; url=/auth/login">
-    </head>
-    <body>
-        <p>Перенаправление на страницу входа...</p>
-        <script>window.location.href = '/auth/login';</script>
-    </body>
-    </html>
-    """
+    return RedirectResponse(url="/auth/login", status_code=307, headers=AUTH_FORM_HEADERS)
 
 
 @router.post("/logout")
@@ -206,19 +224,8 @@ async def logout(request: Request) -> RedirectResponse:
         session_token = request.cookies.get("session_token")
 
         if session_token:
-            # Get user info before destroying session
-            session_data = session_service.get_session(session_token)
-            user_id = session_data.get("user_id") if session_data else None
-
-            # Destroy session using worker
-            try:
-                destroy_user_session_task.delay(session_token, user_id)
-                logger.info(f"Session destruction queued for user {user_id}")
-            except Exception as e:
-                logger.error(f"Failed to queue session destruction: {e}")
-                # Fallback to direct destruction
-                session_service.destroy_session(session_token)
-                logger.info(f"Session destroyed directly for user {user_id}")
+            # Sessions live in this process's memory; destroy_session logs the user it removed
+            session_service.destroy_session(session_token)
 
         # Create response and clear cookie
         response = RedirectResponse(url="/auth/login", status_code=303)
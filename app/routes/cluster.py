@@ -3,85 +3,157 @@ Cluster management API routes.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.middleware.auth import require_admin, require_teacher_access
-from app.services.cluster_service import ClusterService
+from app.services.cache_service import TTLCache
+from worker.celery_cluster import celery_app as cluster_celery_app
 
 
 class ClusteringRequest(BaseModel):
     force_update: bool = False
 
 
+class ClusteringQueuedResponse(BaseModel):
+    status: str
+    message: str
+    task_id: str
+
+
+class ClusterStatistics(BaseModel):
+    total_students: int
+    clustered_students: int
+    clustering_coverage: float
+
+
+class RecentCluster(BaseModel):
+    id: int
+    course_id: int
+    student_id: str
+    cluster_group: str
+    created_at: datetime
+
+
+class ClusterStatusResponse(BaseModel):
+    status: str
+    statistics: ClusterStatistics
+    last_clustering: Optional[datetime] = None
+    recent_clusters: List[RecentCluster]
+
+
 logger = logging.getLogger("app.cluster")
-router = APIRouter(prefix="/api/cluster", tags=["cluster"])
+# orjson serializes the datetimes in status payloads natively
+router = APIRouter(prefix="/api/cluster", tags=["cluster"], default_response_class=ORJSONResponse)
 
-cluster_service = ClusterService()
-# ml_cluster_service = MLClusterService()  # Removed to avoid sklearn import in web app
+# Clustering status is polled by dashboards and only changes when a clustering run finishes
+CLUSTER_STATUS_TTL_SECONDS = 15
+cluster_status_cache = TTLCache(ttl_seconds=CLUSTER_STATUS_TTL_SECONDS, max_entries=1)
 
 
-@router.post("/trigger-clustering")
-async def trigger_clustering(
-    request_data: ClusteringRequest, db: Session = Depends(get_session), _: None = Depends(require_admin)
-) -> Dict[str, Any]:
+def _clustering_status(db: Session) -> Dict[str, Any]:
+    """
+    Build clustering status payload.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary with clustering status
+    """
+    from app.models.cluster import StudentCluster
+    from app.models.student import Student
+
+    total_students = db.query(Student).count()
+    clustered_students = db.query(StudentCluster).count()
+    # Clustering runs replace a course's rows, so this advances once a queued run has finished
+    last_clustering = db.execute(select(func.max(StudentCluster.created_at))).scalar()
+
+    # Get recent clustering jobs as plain rows, only the columns the payload needs
+    recent_clusters = db.execute(
+        select(
+            StudentCluster.id,
+            StudentCluster.course_id,
+            StudentCluster.student_id,
+            StudentCluster.cluster_label.label("cluster_group"),
+            StudentCluster.created_at,
+        )
+        .order_by(StudentCluster.created_at.desc())
+        .limit(10)
+    ).mappings()
+
+    return {
+        "status": "success",
+        "statistics": {
+            "total_students": total_students,
+            "clustered_students": clustered_students,
+            "clustering_coverage": (clustered_students / max(total_students, 1)) * 100,
+        },
+        "last_clustering": last_clustering,
+        "recent_clusters": [dict(cluster) for cluster in recent_clusters],
+    }
+
+
+@router.post("/trigger-clustering", response_model=ClusteringQueuedResponse)
+def trigger_clustering(request_data: ClusteringRequest, _: None = Depends(require_admin)) -> Dict[str, Any]:
     """
     Trigger clustering recalculation for all courses.
 
     Args:
         force_update: Force update even if recent clustering exists
-        db: Database session
 
     Returns:
-        Dictionary with clustering result
+        Dictionary with queued task ID
     """
     try:
         force_update = request_data.force_update
         logger.info(f"Triggering clustering recalculation, force_update={force_update}")
 
-        # Trigger ML clustering for all courses
-        result = cluster_service.cluster_all_courses(db)
+        # Queue ML clustering for all courses on the cluster worker
+        task = cluster_celery_app.send_task("cluster.periodic_cluster_update")
 
-        return {"status": "success", "message": "Clustering recalculation triggered successfully", "result": result}
+        return {"status": "queued", "message": "Clustering recalculation queued successfully", "task_id": task.id}
 
     except Exception as e:
         logger.error(f"Error triggering clustering: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/trigger-clustering-teacher")
-async def trigger_clustering_teacher(request_data: ClusteringRequest, db: Session = Depends(get_session)) -> Dict[str, Any]:
+@router.post("/trigger-clustering-teacher", response_model=ClusteringQueuedResponse)
+def trigger_clustering_teacher(request_data: ClusteringRequest) -> Dict[str, Any]:
     """
     Trigger clustering recalculation for all courses (teacher access).
 
     Args:
         force_update: Force update even if recent clustering exists
-        db: Database session
 
     Returns:
-        Dictionary with clustering result
+        Dictionary with queued task ID
     """
     try:
         force_update = request_data.force_update
         logger.info(f"Triggering clustering recalculation (teacher), force_update={force_update}")
 
-        # Trigger ML clustering for all courses
-        result = cluster_service.cluster_all_courses(db)
+        # Queue ML clustering for all courses on the cluster worker
+        task = cluster_celery_app.send_task("cluster.periodic_cluster_update")
 
-        return {"status": "success", "message": "Clustering recalculation triggered successfully", "result": result}
+        return {"status": "queued", "message": "Clustering recalculation queued successfully", "task_id": task.id}
 
     except Exception as e:
         logger.error(f"Error triggering clustering: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/trigger-course-clustering/{course_id}")
-async def trigger_course_clustering(
-    course_id: int, request_data: ClusteringRequest, db: Session = Depends(get_session), _: None = Depends(require_admin)
+@router.post("/trigger-course-clustering/{course_id}", response_model=ClusteringQueuedResponse)
+def trigger_course_clustering(
+    course_id: int, request_data: ClusteringRequest, _: None = Depends(require_admin)
 ) -> Dict[str, Any]:
     """
     Trigger clustering recalculation for a specific course.
@@ -89,27 +161,26 @@ async def trigger_course_clustering(
     Args:
         course_id: Course ID to cluster
         force_update: Force update even if recent clustering exists
-        db: Database session
 
     Returns:
-        Dictionary with clustering result
+        Dictionary with queued task ID
     """
     try:
         force_update = request_data.force_update
         logger.info(f"Triggering clustering for course {course_id}, force_update={force_update}")
 
-        # Trigger ML clustering for specific course
-        result = cluster_service.cluster_students_by_course(course_id, db)
+        # Queue ML clustering for specific course on the cluster worker
+        task = cluster_celery_app.send_task("cluster.cluster_course_students", args=[course_id])
 
-        return {"status": "success", "message": f"Clustering triggered for course {course_id}", "result": result}
+        return {"status": "queued", "message": f"Clustering queued for course {course_id}", "task_id": task.id}
 
     except Exception as e:
         logger.error(f"Error triggering course clustering: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/status")
-async def get_clustering_status(db: Session = Depends(get_session), _: None = Depends(require_admin)) -> Dict[str, Any]:
+@router.get("/status", response_model=ClusterStatusResponse)
+def get_clustering_status(db: Session = Depends(get_session), _: None = Depends(require_admin)) -> Dict[str, Any]:
     """
     Get current clustering status and statistics.
 
@@ -120,34 +191,28 @@ async def get_clustering_status(db: Session = Depends(get_session), _: None = De
         Dictionary with clustering status
     """
     try:
-        # Get clustering statistics
-        from app.models.cluster import StudentCluster
-        from app.models.student import Student
-
-        total_students = db.query(Student).count()
-        clustered_students = db.query(StudentCluster).count()
-
-        # Get recent clustering jobs
-        recent_clusters = db.query(StudentCluster).order_by(StudentCluster.created_at.desc()).limit(10).all()
-
-        return {
-            "status": "success",
-            "statistics": {
-                "total_students": total_students,
-                "clustered_students": clustered_students,
-                "clustering_coverage": (clustered_students / max(total_students, 1)) * 100,
-            },
-            "recent_clusters": [
-                {
-                    "id": cluster.id,
-                    "course_id": cluster.course_id,
-                    "student_id": cluster.student_id,
-                    "cluster_group": cluster.cluster_group,
-                    "created_at": cluster.created_at,
-                }
-                for cluster in recent_clusters
-            ],
-        }
+        # Served from cache, admin dashboards poll this endpoint
+        return cluster_status_cache.get_or_set("status", lambda: _clustering_status(db))
+
+    except Exception as e:
+        logger.error(f"Error getting clustering status: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/status-teacher", response_model=ClusterStatusResponse)
+def get_clustering_status_teacher(db: Session = Depends(get_session)) -> Dict[str, Any]:
+    """
+    Get current clustering status and statistics (teacher access).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary with clustering status
+    """
+    try:
+        # Polled by the teacher page after queueing a recalculation, shares the admin cache entry
+        return cluster_status_cache.get_or_set("status", lambda: _clustering_status(db))
 
     except Exception as e:
         logger.error(f"Error getting clustering status: {e}")
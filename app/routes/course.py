@@ -2,31 +2,44 @@
 Course detail page routes.
 """
 
+import heapq
 import logging
 from datetime import datetime
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy import and_, case, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Float, case, cast, func, nulls_last, select, true
+from sqlalchemy.orm import Session, load_only
 
 from app.database.session import get_session
 from app.models.student import Attendance, Course, Lesson, Student, Task, TaskCompletion
+from app.ui.templating import templates
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="app/ui/templates")
+
+# Student lists on course pages only render the id and name
+STUDENT_LIST_COLUMNS = load_only(Student.id, Student.name)
+
+
+def _event_date(event: Dict[str, Any]) -> datetime:
+    """Ключ сортировки хронологии: события без даты идут в конец."""
+    return event["date"] or datetime.max
+
+
+def _percent(part: Any, total: Any) -> Any:
+    """SQL-выражение доли part от total в процентах (0, если total пустой)."""
+    return func.coalesce(cast(part, Float) * 100 / func.nullif(total, 0), 0)
 
 
 @router.get("/course/{course_id}", response_class=HTMLResponse)
-async def course_detail(request: Request, course_id: int, db: Session = Depends(get_session)) -> HTMLResponse:
+def course_detail(request: Request, course_id: int, db: Session = Depends(get_session)) -> HTMLResponse:
     """
     Детальная страница курса с составом, датами и мероприятиями.
     """
-    logger.info(f"Rendering course detail page for course {course_id}")
+    logger.debug(f"Rendering course detail page for course {course_id}")
 
     # Получаем информацию о курсе
     course = db.query(Course).filter(Course.id == course_id).first()
@@ -37,73 +50,68 @@ async def course_detail(request: Request, course_id: int, db: Session = Depends(
     lessons = db.query(Lesson).filter(Lesson.course_id == course_id).order_by(Lesson.lesson_number).all()
 
     # Получаем задания курса
-    tasks = db.query(Task).filter(Task.course_id == course_id).order_by(Task.deadline).all()
+    tasks = db.query(Task).filter(Task.course_id == course_id).order_by(nulls_last(Task.deadline)).all()
 
-    # Получаем статистику посещаемости
-    attendance_stats = (
-        db.query(
+    # Получаем статистику посещаемости и выполнения заданий одним запросом
+    attendance_totals = (
+        select(
             func.count(Attendance.id).label("total_attendances"),
-            func.sum(case((Attendance.attended == True, 1), else_=0)).label("attended_count"),
+            func.count(Attendance.id).filter(Attendance.attended == True).label("attended_count"),
         )
+        .select_from(Attendance)
         .join(Lesson)
-        .filter(Lesson.course_id == course_id)
-        .first()
+        .where(Lesson.course_id == course_id)
+        .subquery()
     )
-
-    # Получаем статистику выполнения заданий
-    task_stats = (
-        db.query(
+    completion_totals = (
+        select(
             func.count(TaskCompletion.id).label("total_completions"),
-            func.sum(case((TaskCompletion.status == "Выполнено", 1), else_=0)).label("completed_count"),
+            func.count(TaskCompletion.id).filter(TaskCompletion.status == "Выполнено").label("completed_count"),
         )
+        .select_from(TaskCompletion)
         .join(Task)
-        .filter(Task.course_id == course_id)
-        .first()
+        .where(Task.course_id == course_id)
+        .subquery()
     )
-
-    # Получаем список студентов курса
-    students = db.query(Student).join(Attendance).join(Lesson).filter(Lesson.course_id == course_id).distinct().all()
-
-    # Вычисляем проценты
-    attendance_rate = 0
-    if attendance_stats and attendance_stats.total_attendances > 0:
-        attendance_rate = (attendance_stats.attended_count / attendance_stats.total_attendances) * 100
-
-    completion_rate = 0
-    if task_stats and task_stats.total_completions > 0:
-        completion_rate = (task_stats.completed_count / task_stats.total_completions) * 100
-
-    # Подготавливаем данные для хронологии
-    timeline_events = []
-
-    # Добавляем уроки
-    for lesson in lessons:
-        timeline_events.append(
-            {
-                "type": "lesson",
-                "title": lesson.title,
-                "date": lesson.date,
-                "number": lesson.lesson_number,
-                "icon": "bi-book",
-                "color": "primary",
-            }
+    course_stats = db.execute(
+        select(
+            attendance_totals,
+            completion_totals,
+            _percent(attendance_totals.c.attended_count, attendance_totals.c.total_attendances).label("attendance_rate"),
+            _percent(completion_totals.c.completed_count, completion_totals.c.total_completions).label("completion_rate"),
         )
+        .select_from(attendance_totals)
+        .join(completion_totals, true())
+    ).one()
 
-    # Добавляем задания
-    for task in tasks:
-        timeline_events.append(
-            {
-                "type": "task",
-                "title": task.name,
-                "date": task.deadline,
-                "task_type": task.task_type,
-                "icon": "bi-clipboard-check",
-                "color": "warning" if task.task_type == "assignment" else "info",
-            }
-        )
+    # Получаем список студентов курса
+    student_ids = select(Attendance.student_id).join(Lesson).where(Lesson.course_id == course_id).distinct()
+    students = db.query(Student).options(STUDENT_LIST_COLUMNS).filter(Student.id.in_(student_ids)).all()
 
-    # Сортируем по дате
-    timeline_events.sort(key=lambda x: x["date"] if x["date"] else datetime.max)
+    # Хронология: слияние двух уже отсортированных по дате последовательностей
+    lesson_events = (
+        {
+            "type": "lesson",
+            "title": lesson.title,
+            "date": lesson.date,
+            "number": lesson.lesson_number,
+            "icon": "bi-book",
+            "color": "primary",
+        }
+        for lesson in sorted(lessons, key=lambda lesson: lesson.date or datetime.max)
+    )
+    task_events = (
+        {
+            "type": "task",
+            "title": task.name,
+            "date": task.deadline,
+            "task_type": task.task_type,
+            "icon": "bi-clipboard-check",
+            "color": "warning" if task.task_type == "assignment" else "info",
+        }
+        for task in tasks
+    )
+    timeline_events = list(heapq.merge(lesson_events, task_events, key=_event_date))
 
     return templates.TemplateResponse(
         "course/detail.html",
@@ -114,80 +122,97 @@ async def course_detail(request: Request, course_id: int, db: Session = Depends(
             "lessons": lessons,
             "tasks": tasks,
             "students": students,
-            "attendance_rate": round(attendance_rate, 1),
-            "completion_rate": round(completion_rate, 1),
+            "attendance_rate": round(course_stats.attendance_rate, 1),
+            "completion_rate": round(course_stats.completion_rate, 1),
             "timeline_events": timeline_events,
             "stats": {
                 "total_lessons": len(lessons),
                 "total_tasks": len(tasks),
                 "total_students": len(students),
-                "attendance_count": attendance_stats.attended_count if attendance_stats else 0,
-                "total_attendances": attendance_stats.total_attendances if attendance_stats else 0,
-                "completed_tasks": task_stats.completed_count if task_stats else 0,
-                "total_completions": task_stats.total_completions if task_stats else 0,
+                "attendance_count": course_stats.attended_count,
+                "total_attendances": course_stats.total_attendances,
+                "completed_tasks": course_stats.completed_count,
+                "total_completions": course_stats.total_completions,
             },
         },
     )
 
 
 @router.get("/course/{course_id}/students", response_class=HTMLResponse)
-async def course_students(request: Request, course_id: int, db: Session = Depends(get_session)) -> HTMLResponse:
+def course_students(request: Request, course_id: int, db: Session = Depends(get_session)) -> HTMLResponse:
     """
     Список студентов курса с их статистикой.
     """
-    logger.info(f"Rendering course students page for course {course_id}")
+    logger.debug(f"Rendering course students page for course {course_id}")
 
     # Получаем информацию о курсе
     course = db.query(Course).filter(Course.id == course_id).first()
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    # Получаем студентов с их статистикой
-    students_data = []
-    students = db.query(Student).join(Attendance).join(Lesson).filter(Lesson.course_id == course_id).distinct().all()
-
-    for student in students:
-        # Статистика посещаемости студента
-        student_attendance = (
-            db.query(
-                func.count(Attendance.id).label("total"),
-                func.sum(case((Attendance.attended == True, 1), else_=0)).label("attended"),
-            )
-            .join(Lesson)
-            .filter(and_(Lesson.course_id == course_id, Attendance.student_id == student.id))
-            .first()
+    # Статистика посещаемости и заданий по студентам, сгруппированная в SQL
+    attendance = (
+        db.query(
+            Attendance.student_id,
+            func.count(Attendance.id).label("total"),
+            func.sum(case((Attendance.attended == True, 1), else_=0)).label("attended"),
         )
-
-        # Статистика выполнения заданий
-        student_tasks = (
-            db.query(
-                func.count(TaskCompletion.id).label("total"),
-                func.sum(case((TaskCompletion.status == "Выполнено", 1), else_=0)).label("completed"),
-            )
-            .join(Task)
-            .filter(and_(Task.course_id == course_id, TaskCompletion.student_id == student.id))
-            .first()
+        .join(Lesson)
+        .filter(Lesson.course_id == course_id)
+        .group_by(Attendance.student_id)
+        .subquery()
+    )
+    completions = (
+        db.query(
+            TaskCompletion.student_id,
+            func.count(TaskCompletion.id).label("total"),
+            func.sum(case((TaskCompletion.status == "Выполнено", 1), else_=0)).label("completed"),
         )
+        .join(Task)
+        .filter(Task.course_id == course_id)
+        .group_by(TaskCompletion.student_id)
+        .subquery()
+    )
 
-        attendance_rate = 0
-        if student_attendance and student_attendance.total > 0:
-            attendance_rate = (student_attendance.attended / student_attendance.total) * 100
-
-        completion_rate = 0
-        if student_tasks and student_tasks.total > 0:
-            completion_rate = (student_tasks.completed / student_tasks.total) * 100
-
-        students_data.append(
-            {
-                "student": student,
-                "attendance_rate": round(attendance_rate, 1),
-                "completion_rate": round(completion_rate, 1),
-                "total_attendances": student_attendance.total if student_attendance else 0,
-                "attended_count": student_attendance.attended if student_attendance else 0,
-                "total_tasks": student_tasks.total if student_tasks else 0,
-                "completed_tasks": student_tasks.completed if student_tasks else 0,
-            }
+    # Получаем студентов курса (с посещаемостью) вместе с их статистикой и процентами одним запросом
+    task_total = func.coalesce(completions.c.total, 0)
+    task_completed = func.coalesce(completions.c.completed, 0)
+    rows = (
+        db.query(
+            Student,
+            attendance.c.total,
+            attendance.c.attended,
+            task_total,
+            task_completed,
+            _percent(attendance.c.attended, attendance.c.total),
+            _percent(task_completed, task_total),
         )
+        .options(STUDENT_LIST_COLUMNS)
+        .join(attendance, attendance.c.student_id == Student.id)
+        .outerjoin(completions, completions.c.student_id == Student.id)
+        .all()
+    )
+
+    students_data = [
+        {
+            "student": student,
+            "attendance_rate": round(attendance_rate, 1),
+            "completion_rate": round(completion_rate, 1),
+            "total_attendances": total_attendances,
+            "attended_count": attended_count,
+            "total_tasks": total_tasks,
+            "completed_tasks": completed_tasks,
+        }
+        for (
+            student,
+            total_attendances,
+            attended_count,
+            total_tasks,
+            completed_tasks,
+            attendance_rate,
+            completion_rate,
+        ) in rows
+    ]
 
     return templates.TemplateResponse(
         "course/students.html",
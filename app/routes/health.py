@@ -2,28 +2,82 @@
 Health check endpoints.
 """
 
+import asyncio
 import logging
+import os
+import platform
 import time
-from datetime import datetime, timedelta
-from typing import Any, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
 import psutil
-import pytz
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.database.engine import engine
 from app.database.session import get_session
+from app.services.cache_service import TTLCache
+from app.services.rabbitmq_pool import rabbitmq_pool
+from app.ui.templating import templates
 
 router = APIRouter()
 logger = logging.getLogger("app.health")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
 
-# GMT+5 timezone (UTC+5)
-GMT_PLUS_5 = pytz.timezone("Asia/Karachi")  # GMT+5
+# GMT+5 timezone (UTC+5), a fixed offset so no tz database lookup is needed
+GMT_PLUS_5 = timezone(timedelta(hours=5))
+
+
+SERVICE_NAME = "PulseEdu"
+SERVICE_VERSION = "0.1.1"
+
+HEALTH_CHECK_TTL_SECONDS = 5
+health_cache = TTLCache(ttl_seconds=HEALTH_CHECK_TTL_SECONDS, max_entries=8)
+
+# psutil reads behind /status and /status/diagnostics, shared between polling clients
+METRICS_TTL_SECONDS = 10
+NETWORK_DIAGNOSTICS_TTL_SECONDS = 30
+metrics_cache = TTLCache(ttl_seconds=METRICS_TTL_SECONDS, max_entries=8)
+network_cache = TTLCache(ttl_seconds=NETWORK_DIAGNOSTICS_TTL_SECONDS, max_entries=1)
+
+# Flower probes reuse keep-alive connections instead of a new client per /status hit
+flower_client = httpx.AsyncClient(base_url="http://flower:5555", timeout=2.0, limits=httpx.Limits(max_keepalive_connections=4))
+
+# Host facts that do not change while the process runs
+PLATFORM_INFO = {
+    "platform": platform.platform(),
+    "system": platform.system(),
+    "release": platform.release(),
+    "machine": platform.machine(),
+    "python_version": platform.python_version(),
+    "hostname": platform.node(),
+}
+PLATFORM_PROCESSOR = platform.processor().strip()
+BOOT_TIME = datetime.fromtimestamp(psutil.boot_time())
+PROCESS_STARTED_AT = datetime.fromtimestamp(psutil.Process().create_time())
+HAS_LOADAVG = hasattr(os, "getloadavg")
+
+SOCKSTAT_PATHS = ("/proc/net/sockstat", "/proc/net/sockstat6")
+SOCKSTAT_INET_PROTOCOLS = {"TCP", "UDP", "TCP6", "UDP6"}
+
+# First non-blocking cpu_percent() call only sets the baseline for the next one
+psutil.cpu_percent(interval=None)
+
+
+# Database facts for the status pages, each fetched in a single round trip
+DATABASE_STATUS_SQL = text("SELECT version() AS version, pg_size_pretty(pg_database_size(current_database())) AS size")
+DATABASE_DIAGNOSTICS_SQL = text(
+    """
+    SELECT
+        version() AS version,
+        pg_size_pretty(pg_database_size(current_database())) AS size,
+        (SELECT array_agg(tablename ORDER BY tablename) FROM pg_tables WHERE schemaname = 'public') AS tables,
+        (SELECT count(*) FROM pg_stat_activity WHERE state = 'active') AS connections
+    """
+)
 
 
 def get_gmt_plus_5_time() -> datetime:
@@ -34,42 +88,67 @@ def get_gmt_plus_5_time() -> datetime:
 def format_gmt_plus_5_time(dt: datetime, format_str: str = "%d.%m.%Y %H:%M:%S") -> str:
     """Format datetime in GMT+5 timezone."""
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(GMT_PLUS_5).strftime(format_str)
 
 
-@router.get("/healthz")
-async def health_check() -> Dict[str, Any]:
-    """
-    Health check endpoint for Kubernetes/Docker health probes.
+BOOT_TIME_DISPLAY = format_gmt_plus_5_time(BOOT_TIME) + " GMT+5"
 
-    Returns:
-        Dict with status information
-    """
-    logger.info("Health check requested")
 
-    return {"status": "ok", "service": "PulseEdu", "version": "0.1.1"}
+def format_uptime(uptime: timedelta) -> str:
+    """Format uptime like str(timedelta) without the microseconds, e.g. '2 days, 3:04:05'."""
+    minutes, seconds = divmod(int(uptime.total_seconds()), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    clock = f"{hours}:{minutes:02d}:{seconds:02d}"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {clock}"
+    return clock
+
 
+def get_load_average() -> Optional[Tuple[float, float, float]]:
+    """Read the 1/5/15 minute load average with one syscall, None where the platform lacks it."""
+    return os.getloadavg() if HAS_LOADAVG else None
 
-@router.get("/health")
-async def detailed_health() -> Dict[str, Any]:
+
+def check_database() -> str:
+    """Ping the database, reusing the result for a few seconds so probes can't hammer Postgres."""
+
+    def ping() -> str:
+        try:
+            # Checkout alone is the liveness check: pool_pre_ping pings reused connections through the
+            # driver, and a new connection is validated by connecting
+            with engine.connect():
+                pass
+            return "ok"
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return "unavailable"
+
+    return health_cache.get_or_set("database", ping)
+
+
+@router.get("/health", response_class=ORJSONResponse)
+def detailed_health() -> ORJSONResponse:
     """
     Detailed health check with component status.
 
     Returns:
         Dict with detailed health information
     """
-    logger.info("Detailed health check requested")
+    logger.debug("Detailed health check requested")
 
-    # TODO: Add database connectivity check in future iterations
     # TODO: Add message broker connectivity check in future iterations
-
-    return {
-        "status": "ok",
-        "service": "PulseEdu",
-        "version": "0.1.1",
-        "components": {"database": "not_implemented", "message_broker": "not_implemented", "llm_provider": "not_implemented"},
-    }
+    database = check_database()
+
+    return ORJSONResponse(
+        {
+            "status": "ok" if database == "ok" else "degraded",
+            "service": SERVICE_NAME,
+            "version": SERVICE_VERSION,
+            "components": {"database": database, "message_broker": "not_implemented", "llm_provider": "not_implemented"},
+        }
+    )
 
 
 @router.get("/status", response_class=HTMLResponse)
@@ -87,17 +166,10 @@ async def system_status(request: Request, db: Session = Depends(get_session)) ->
     logger.info("System status page requested")
 
     try:
-        # Get system metrics
-        system_metrics = await get_system_metrics()
-
-        # Get component status
-        component_status = await get_component_status(db)
-
-        # Get performance metrics
-        performance_metrics = await get_performance_metrics()
-
-        # Get incident history
-        incident_history = await get_incident_history()
+        # Independent probes run concurrently, so the page waits for the slowest one only
+        system_metrics, component_status, performance_metrics, incident_history = await asyncio.gather(
+            get_system_metrics(), get_component_status(db), get_performance_metrics(), get_incident_history()
+        )
 
         return templates.TemplateResponse(
             "status.html",
@@ -126,10 +198,15 @@ async def system_status(request: Request, db: Session = Depends(get_session)) ->
 
 
 async def get_system_metrics() -> Dict[str, Any]:
-    """Get system resource metrics."""
+    """Get system resource metrics, reused for a few seconds between /status polls."""
+    return await asyncio.to_thread(metrics_cache.get_or_set, "system", read_system_metrics)
+
+
+def read_system_metrics() -> Dict[str, Any]:
+    """Read system resource metrics from psutil."""
     try:
-        # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU usage since the previous call (primed at import), without sleeping
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         # Memory usage
         memory = psutil.virtual_memory()
@@ -138,8 +215,7 @@ async def get_system_metrics() -> Dict[str, Any]:
         disk = psutil.disk_usage("/")
 
         # System uptime
-        boot_time = psutil.boot_time()
-        uptime = datetime.now() - datetime.fromtimestamp(boot_time)
+        uptime = datetime.now() - BOOT_TIME
 
         return {
             "cpu_usage": cpu_percent,
@@ -149,8 +225,8 @@ async def get_system_metrics() -> Dict[str, Any]:
             "disk_usage": disk.percent,
             "disk_free": disk.free // (1024**3),  # GB
             "disk_total": disk.total // (1024**3),  # GB
-            "uptime": str(uptime).split(".")[0],  # Remove microseconds
-            "boot_time": format_gmt_plus_5_time(datetime.fromtimestamp(boot_time)) + " GMT+5",
+            "uptime": format_uptime(uptime),
+            "boot_time": BOOT_TIME_DISPLAY,
         }
     except Exception as e:
         logger.error(f"Error getting system metrics: {e}")
@@ -167,129 +243,130 @@ async def get_system_metrics() -> Dict[str, Any]:
         }
 
 
+def get_pool_status() -> Dict[str, Any]:
+    """Snapshot of the SQLAlchemy connection pool, to spot saturation."""
+    pool = engine.pool
+    try:
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checked_in": pool.checkedin(),
+        }
+    except AttributeError:
+        # Pools without QueuePool counters (e.g. StaticPool in tests)
+        return {}
+
+
 async def get_component_status(db: Session) -> Dict[str, Any]:
-    """Get status of system components."""
+    """Get status of system components, probing them concurrently."""
     try:
-        # Test database connection
-        db_status = "healthy"
-        db_response_time = 0
-        db_version = "unknown"
-        db_size = "unknown"
-        try:
-            from sqlalchemy import text
-
-            start_time = time.time()
-            db.execute(text("SELECT 1"))
-            db_response_time = round((time.time() - start_time) * 1000, 2)  # ms
-
-            # Get database version
-            try:
-                result = db.execute(text("SELECT version()"))
-                version = result.fetchone()[0]
-                db_version = version.split(",")[0]  # Get just the main version info
-            except:
-                pass
+        last_check = get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5")
+        database, rabbitmq, celery = await asyncio.gather(
+            asyncio.to_thread(get_database_component, db, last_check),
+            asyncio.to_thread(get_rabbitmq_component, last_check),
+            get_celery_component(last_check),
+        )
+        return {"database": database, "rabbitmq": rabbitmq, "celery": celery}
+    except Exception as e:
+        logger.error(f"Error getting component status: {e}")
+        return {}
 
-            # Get database size
-            try:
-                result = db.execute(text("SELECT pg_size_pretty(pg_database_size(current_database()))"))
-                db_size = result.fetchone()[0]
-            except:
-                pass
 
-        except Exception as e:
-            db_status = "unhealthy"
-            logger.error(f"Database health check failed: {e}")
+def get_database_component(db: Session, last_check: str) -> Dict[str, Any]:
+    """Test database connection and read version and size."""
+    db_status = "healthy"
+    db_response_time = 0
+    db_version = "unknown"
+    db_size = "unknown"
+    try:
+        start_time = time.time()
+        row = db.execute(DATABASE_STATUS_SQL).one()
+        db_response_time = round((time.time() - start_time) * 1000, 2)  # ms
+        db_version = row.version.split(",")[0]  # Get just the main version info
+        db_size = row.size
+    except Exception as e:
+        db_status = "unhealthy"
+        logger.error(f"Database health check failed: {e}")
 
-        # Get real component status
-        components = {
-            "database": {
-                "status": db_status,
-                "response_time": db_response_time,
-                "version": db_version,
-                "size": db_size,
-                "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-            }
-        }
+    return {
+        "status": db_status,
+        "response_time": db_response_time,
+        "version": db_version,
+        "size": db_size,
+        "pool": get_pool_status(),
+        "last_check": last_check,
+    }
 
-        # Test RabbitMQ connection
-        try:
-            import pika
 
-            start_time = time.time()
-            connection = pika.BlockingConnection(
-                pika.ConnectionParameters("mq", 5672, "/", pika.PlainCredentials("pulseedu", "pulseedu"))
-            )
-            connection.close()
-            rabbitmq_response_time = round((time.time() - start_time) * 1000, 2)  # ms
-            components["rabbitmq"] = {
-                "status": "healthy",
-                "response_time": rabbitmq_response_time,
-                "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-            }
-        except Exception as e:
-            components["rabbitmq"] = {
-                "status": "unhealthy",
-                "response_time": 0,
-                "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-                "error": str(e),
-            }
+def get_rabbitmq_component(last_check: str) -> Dict[str, Any]:
+    """Test RabbitMQ connection over the shared long-lived connection."""
+    try:
+        rabbitmq_response_time = rabbitmq_pool.ping()  # ms
+        return {
+            "status": "healthy",
+            "response_time": rabbitmq_response_time,
+            "last_check": last_check,
+        }
+    except Exception as e:
+        return {
+            "status": "unhealthy",
+            "response_time": 0,
+            "last_check": last_check,
+            "error": str(e),
+        }
 
-        # Test Celery (Flower) connection
-        try:
-            import httpx
 
-            start_time = time.time()
-            response = httpx.get("http://flower:5555/", timeout=5.0)
-            celery_response_time = round((time.time() - start_time) * 1000, 2)  # ms
-            if response.status_code == 200:
-                components["celery"] = {
-                    "status": "healthy",
-                    "response_time": celery_response_time,
-                    "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-                }
-            else:
-                components["celery"] = {
-                    "status": "unhealthy",
-                    "response_time": celery_response_time,
-                    "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-                    "error": f"HTTP {response.status_code}",
-                }
-        except Exception as e:
-            components["celery"] = {
-                "status": "unhealthy",
-                "response_time": 0,
-                "last_check": get_gmt_plus_5_time().strftime("%H:%M:%S GMT+5"),
-                "error": str(e),
+async def get_celery_component(last_check: str) -> Dict[str, Any]:
+    """Test Celery (Flower) connection."""
+    try:
+        start_time = time.time()
+        response = await flower_client.get("/")
+        celery_response_time = round((time.time() - start_time) * 1000, 2)  # ms
+        if response.status_code == 200:
+            return {
+                "status": "healthy",
+                "response_time": celery_response_time,
+                "last_check": last_check,
             }
-
-        return components
+        return {
+            "status": "unhealthy",
+            "response_time": celery_response_time,
+            "last_check": last_check,
+            "error": f"HTTP {response.status_code}",
+        }
     except Exception as e:
-        logger.error(f"Error getting component status: {e}")
-        return {}
+        return {
+            "status": "unhealthy",
+            "response_time": 0,
+            "last_check": last_check,
+            "error": str(e),
+        }
 
 
 async def get_performance_metrics() -> Dict[str, Any]:
-    """Get performance metrics."""
-    try:
-        # Get real performance data
-        import os
+    """Get performance metrics, reused for a few seconds between /status polls."""
+    return await asyncio.to_thread(metrics_cache.get_or_set, "performance", read_performance_metrics)
+
 
+def read_performance_metrics() -> Dict[str, Any]:
+    """Read web process and load metrics from psutil."""
+    try:
         # Get process information
         current_process = psutil.Process(os.getpid())
 
-        return {
-            "process_info": {
+        # Read all process attributes from a single pass over /proc/<pid>
+        with current_process.oneshot():
+            process_info = {
                 "cpu_percent": current_process.cpu_percent(),
                 "memory_mb": round(current_process.memory_info().rss / 1024 / 1024, 2),
                 "threads": current_process.num_threads(),
                 "open_files": len(current_process.open_files()) if hasattr(current_process, "open_files") else 0,
-            },
-            "system_load": {
-                "load_1min": os.getloadavg()[0] if hasattr(os, "getloadavg") else "N/A",
-                "load_5min": os.getloadavg()[1] if hasattr(os, "getloadavg") else "N/A",
-                "load_15min": os.getloadavg()[2] if hasattr(os, "getloadavg") else "N/A",
-            },
+            }
+
+        return {
+            "process_info": process_info,
+            "system_load": dict(zip(("load_1min", "load_5min", "load_15min"), get_load_average() or ("N/A",) * 3)),
         }
     except Exception as e:
         logger.error(f"Error getting performance metrics: {e}")
@@ -321,17 +398,13 @@ async def system_diagnostics(request: Request, db: Session = Depends(get_session
     logger.info("System diagnostics page requested")
 
     try:
-        # Get detailed system information
-        system_info = await get_detailed_system_info()
-
-        # Get database diagnostics
-        db_diagnostics = await get_database_diagnostics(db)
-
-        # Get service diagnostics
-        service_diagnostics = await get_service_diagnostics()
-
-        # Get network diagnostics
-        network_diagnostics = await get_network_diagnostics()
+        # Independent probes run concurrently, so the page waits for the slowest one only
+        system_info, db_diagnostics, service_diagnostics, network_diagnostics = await asyncio.gather(
+            asyncio.to_thread(get_detailed_system_info),
+            asyncio.to_thread(get_database_diagnostics, db),
+            get_service_diagnostics(),
+            get_network_diagnostics(),
+        )
 
         return templates.TemplateResponse(
             "diagnostics.html",
@@ -359,32 +432,18 @@ async def system_diagnostics(request: Request, db: Session = Depends(get_session
         )
 
 
-async def get_detailed_system_info() -> Dict[str, Any]:
+def get_detailed_system_info() -> Dict[str, Any]:
     """Get detailed system information."""
     try:
-        # System information
-        import os
-        import platform
-
-        # Only include meaningful values
-        info = {
-            "platform": platform.platform(),
-            "system": platform.system(),
-            "release": platform.release(),
-            "machine": platform.machine(),
-            "python_version": platform.python_version(),
-            "hostname": platform.node(),
-            "processes": len(psutil.pids()),
-        }
+        info = {**PLATFORM_INFO, "processes": len(psutil.pids())}
 
         # Add processor only if it's not empty
-        processor = platform.processor()
-        if processor and processor.strip():
-            info["processor"] = processor
+        if PLATFORM_PROCESSOR:
+            info["processor"] = PLATFORM_PROCESSOR
 
         # Add load average only if available
-        if hasattr(os, "getloadavg"):
-            load_avg = os.getloadavg()
+        load_avg = get_load_average()
+        if load_avg:
             info["load_average"] = f"{load_avg[0]:.2f}, {load_avg[1]:.2f}, {load_avg[2]:.2f}"
 
         return info
@@ -393,7 +452,7 @@ async def get_detailed_system_info() -> Dict[str, Any]:
         return {}
 
 
-async def get_database_diagnostics(db: Session) -> Dict[str, Any]:
+def get_database_diagnostics(db: Session) -> Dict[str, Any]:
     """Get database diagnostics."""
     try:
         diagnostics = {
@@ -405,47 +464,18 @@ async def get_database_diagnostics(db: Session) -> Dict[str, Any]:
             "locks": 0,
         }
 
-        # Test connection
         try:
-            from sqlalchemy import text
-
-            result = db.execute(text("SELECT version()"))
-            version = result.fetchone()[0]
-            diagnostics["connection"] = "connected"
-            diagnostics["version"] = version
+            row = db.execute(DATABASE_DIAGNOSTICS_SQL).one()
+            diagnostics.update(
+                connection="connected",
+                version=row.version,
+                size=row.size,
+                tables=row.tables or [],
+                connections=row.connections,
+            )
         except Exception as e:
             diagnostics["connection"] = f"error: {str(e)}"
 
-        # Get database size
-        try:
-            from sqlalchemy import text
-
-            result = db.execute(text("SELECT pg_size_pretty(pg_database_size(current_database()))"))
-            size = result.fetchone()[0]
-            diagnostics["size"] = size
-        except Exception as e:
-            diagnostics["size"] = f"error: {str(e)}"
-
-        # Get table list
-        try:
-            from sqlalchemy import text
-
-            result = db.execute(text("SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename"))
-            tables = [row[0] for row in result.fetchall()]
-            diagnostics["tables"] = tables
-        except Exception as e:
-            diagnostics["tables"] = [f"error: {str(e)}"]
-
-        # Get connection count
-        try:
-            from sqlalchemy import text
-
-            result = db.execute(text("SELECT count(*) FROM pg_stat_activity WHERE state = 'active'"))
-            connections = result.fetchone()[0]
-            diagnostics["connections"] = connections
-        except Exception as e:
-            diagnostics["connections"] = f"error: {str(e)}"
-
         return diagnostics
     except Exception as e:
         logger.error(f"Error getting database diagnostics: {e}")
@@ -459,12 +489,11 @@ async def get_service_diagnostics() -> Dict[str, Any]:
         services = {}
 
         # Web server info
-        current_process = psutil.Process()
         services["web_server"] = {
             "status": "running",
             "port": 8000,
-            "pid": current_process.pid,
-            "uptime": str(datetime.now() - datetime.fromtimestamp(current_process.create_time())).split(".")[0],
+            "pid": os.getpid(),
+            "uptime": format_uptime(datetime.now() - PROCESS_STARTED_AT),
         }
 
         # Database info (already tested in component status)
@@ -472,12 +501,7 @@ async def get_service_diagnostics() -> Dict[str, Any]:
 
         # RabbitMQ info
         try:
-            import pika
-
-            connection = pika.BlockingConnection(
-                pika.ConnectionParameters("mq", 5672, "/", pika.PlainCredentials("pulseedu", "pulseedu"))
-            )
-            connection.close()
+            await asyncio.to_thread(rabbitmq_pool.ping)
             services["rabbitmq"] = {
                 "status": "running",
                 "port": 5672,
@@ -488,9 +512,7 @@ async def get_service_diagnostics() -> Dict[str, Any]:
 
         # Celery info
         try:
-            import httpx
-
-            response = httpx.get("http://flower:5555/", timeout=5.0)
+            response = await flower_client.get("/")
             if response.status_code == 200:
                 services["celery"] = {"status": "running", "port": 5555, "uptime": "N/A"}  # Would need to query Flower API
             else:
@@ -505,7 +527,36 @@ async def get_service_diagnostics() -> Dict[str, Any]:
 
 
 async def get_network_diagnostics() -> Dict[str, Any]:
-    """Get network diagnostics."""
+    """Get network diagnostics, reused for longer since net_connections walks /proc/net/*."""
+    return await asyncio.to_thread(network_cache.get_or_set, "network", read_network_diagnostics)
+
+
+def count_inet_sockets() -> int:
+    """
+    Count TCP/UDP sockets in use.
+
+    On Linux this reads the in-use counters from /proc/net/sockstat{,6} (two small reads) instead of
+    letting psutil.net_connections() parse every line of /proc/net/{tcp,udp}{,6}.
+
+    Returns:
+        Number of inet sockets in use
+    """
+    try:
+        total = 0
+        for path in SOCKSTAT_PATHS:
+            with open(path) as sockstat:
+                for line in sockstat:
+                    protocol, _, counters = line.partition(":")
+                    if protocol in SOCKSTAT_INET_PROTOCOLS:
+                        fields = counters.split()
+                        total += int(fields[fields.index("inuse") + 1])
+        return total
+    except (OSError, ValueError, IndexError):
+        return len(psutil.net_connections(kind="inet"))
+
+
+def read_network_diagnostics() -> Dict[str, Any]:
+    """Read network interfaces, connection count and I/O counters from psutil."""
     try:
         import socket
 
@@ -517,7 +568,7 @@ async def get_network_diagnostics() -> Dict[str, Any]:
                     interfaces.append({"name": interface, "ip": addr.address, "netmask": addr.netmask})
 
         # Get network connections
-        connections = len(psutil.net_connections())
+        connections = count_inet_sockets()
 
         # Get network I/O
         net_io = psutil.net_io_counters()
@@ -2,27 +2,27 @@
 Import routes for file upload and processing.
 """
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.middleware.auth import require_import_access
 from app.models.import_models import ImportErrorLog, ImportJob
 from app.services.import_service import ImportService
+from app.ui.templating import templates
 from worker.tasks import process_import_job
 
 router = APIRouter(prefix="/import", tags=["import"])
 logger = logging.getLogger("app.import")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
 
 # Initialize import service
 import_service = ImportService()
@@ -33,7 +33,7 @@ async def import_page(request: Request) -> HTMLResponse:
     """
     Import page for uploading Excel files.
     """
-    logger.info("Import page requested")
+    logger.debug("Import page requested")
 
     return templates.TemplateResponse("import/upload.html", {"request": request, "title": "Импорт данных"})
 
@@ -60,11 +60,8 @@ async def upload_file(request: Request, file: UploadFile = File(...), db: Sessio
         # Generate job ID
         job_id = f"import_{uuid.uuid4().hex[:12]}"
 
-        # Read file content
-        file_content = await file.read()
-
-        # Save file
-        file_path = import_service.save_uploaded_file(file_content, file.filename)
+        # Stream the spooled upload to disk in a worker thread
+        file_path = await asyncio.to_thread(import_service.save_uploaded_file, file.file, file.filename)
 
         # Create import job
         job = ImportJob(
@@ -96,41 +93,50 @@ async def upload_file(request: Request, file: UploadFile = File(...), db: Sessio
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
-@router.get("/jobs")
-async def list_jobs(request: Request, db: Session = Depends(get_session)) -> Dict[str, Any]:
+@router.get("/jobs", response_class=ORJSONResponse)
+def list_jobs(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_session),
+) -> ORJSONResponse:
     """
-    List all import jobs.
+    List import jobs, newest first.
 
     Args:
+        limit: Page size
+        offset: Number of jobs to skip
         db: Database session
 
     Returns:
-        List of import jobs
+        Page of import jobs
     """
-    logger.info("Import jobs list requested")
-
-    jobs = db.query(ImportJob).order_by(ImportJob.created_at.desc()).limit(50).all()
-
-    jobs_data = []
-    for job in jobs:
-        jobs_data.append(
-            {
-                "job_id": job.job_id,
-                "original_filename": job.original_filename,
-                "status": job.status,
-                "total_rows": job.total_rows,
-                "processed_rows": job.processed_rows,
-                "error_rows": job.error_rows,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            }
+    logger.debug("Import jobs list requested")
+
+    # Plain rows of the listed columns: no errors_json, no ORM objects
+    rows = db.execute(
+        select(
+            ImportJob.job_id,
+            ImportJob.original_filename,
+            ImportJob.status,
+            ImportJob.total_rows,
+            ImportJob.processed_rows,
+            ImportJob.error_rows,
+            ImportJob.created_at,
+            ImportJob.completed_at,
         )
+        .order_by(ImportJob.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
 
-    return {"status": "success", "jobs": jobs_data, "total": len(jobs_data)}
+    # orjson encodes the datetimes directly; returning the response skips FastAPI's jsonable_encoder pass
+    jobs_data = [row._asdict() for row in rows]
+    return ORJSONResponse({"status": "success", "jobs": jobs_data, "total": len(jobs_data), "limit": limit, "offset": offset})
 
 
-@router.get("/jobs/{job_id}")
-async def get_job_details(job_id: str, request: Request, db: Session = Depends(get_session)) -> Dict[str, Any]:
+@router.get("/jobs/{job_id}", response_class=ORJSONResponse)
+def get_job_details(job_id: str, request: Request, db: Session = Depends(get_session)) -> ORJSONResponse:
     """
     Get detailed information about import job.
 
@@ -141,41 +147,51 @@ async def get_job_details(job_id: str, request: Request, db: Session = Depends(g
     Returns:
         Job details with errors
     """
-    logger.info(f"Job details requested: {job_id}")
-
-    job = db.query(ImportJob).filter(ImportJob.job_id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    # Get errors
-    errors = db.query(ImportErrorLog).filter(ImportErrorLog.job_id == job_id).all()
-
-    errors_data = []
-    for error in errors:
-        errors_data.append(
-            {
-                "row_number": error.row_number,
-                "column_name": error.column_name,
-                "error_type": error.error_type,
-                "error_message": error.error_message,
-                "cell_value": error.cell_value,
-                "created_at": error.created_at.isoformat(),
-            }
+    logger.debug(f"Job details requested: {job_id}")
+
+    # Job and its errors in one round trip, errors aggregated into a JSON array by Postgres
+    errors = (
+        select(
+            func.json_agg(
+                func.json_build_object(
+                    "row_number",
+                    ImportErrorLog.row_number,
+                    "column_name",
+                    ImportErrorLog.column_name,
+                    "error_type",
+                    ImportErrorLog.error_type,
+                    "error_message",
+                    ImportErrorLog.error_message,
+                    "cell_value",
+                    ImportErrorLog.cell_value,
+                    "created_at",
+                    ImportErrorLog.created_at,
+                )
+            )
         )
+        .where(ImportErrorLog.job_id == ImportJob.job_id)
+        .scalar_subquery()
+    )
+    row = db.execute(select(ImportJob, errors.label("errors")).where(ImportJob.job_id == job_id)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    return {
-        "status": "success",
-        "job": {
-            "job_id": job.job_id,
-            "original_filename": job.original_filename,
-            "status": job.status,
-            "total_rows": job.total_rows,
-            "processed_rows": job.processed_rows,
-            "error_rows": job.error_rows,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "errors_json": job.errors_json,
-        },
-        "errors": errors_data,
-    }
+    job = row.ImportJob
+    return ORJSONResponse(
+        {
+            "status": "success",
+            "job": {
+                "job_id": job.job_id,
+                "original_filename": job.original_filename,
+                "status": job.status,
+                "total_rows": job.total_rows,
+                "processed_rows": job.processed_rows,
+                "error_rows": job.error_rows,
+                "created_at": job.created_at,
+                "started_at": job.started_at,
+                "completed_at": job.completed_at,
+                "errors_json": job.errors_json,
+            },
+            "errors": row.errors or [],
+        }
+    )
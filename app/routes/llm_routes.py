@@ -3,29 +3,117 @@ LLM API routes for recommendations and feedback.
 """
 
 import logging
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+from sqlalchemy import bindparam, case, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.models.llm_models import LLMFeedback, LLMRecommendation
+from app.services.cache_service import TTLCache
+from app.services.etag_service import compute_etag, etag_matches, not_modified_response
 from app.services.llm_provider import LLMProvider
 from app.services.markdown_service import MarkdownService
 from app.services.student_service import StudentService
 from worker.llm_tasks import generate_recommendations_task
 
+
+class BulkApprovalItem(BaseModel):
+    recommendation_id: int
+    is_approved: bool
+    edited_recommendation: str = ""
+
+
+class LLMStatsResponse(BaseModel):
+    total_recommendations: int
+    active_recommendations: int
+    total_feedback: int
+    student_ratings: int
+    teacher_approvals: int
+    average_rating: float
+    period: str
+
+
+class TeacherRecommendationItem(BaseModel):
+    id: int
+    student_id: str
+    course_id: str
+    course_name: str
+    text_content: str
+    html_content: str
+    student_rating: Optional[int]
+    teacher_status: str
+    created_at: datetime
+    expires_at: datetime
+
+
+class TeacherRecommendationsResponse(BaseModel):
+    status: str
+    recommendations: List[TeacherRecommendationItem]
+    total: int
+    has_more: bool
+    limit: int
+    offset: int
+    courses: List[str]
+
+
 logger = logging.getLogger("app.llm_routes")
 
-router = APIRouter(prefix="/api/llm", tags=["llm"])
+# orjson serializes the datetimes in recommendation payloads natively
+router = APIRouter(prefix="/api/llm", tags=["llm"], default_response_class=ORJSONResponse)
 
 llm_provider = LLMProvider()
 markdown_service = MarkdownService()
 student_service = StudentService()
 
+# Usage stats are polled by dashboards; rating/approval endpoints drop the entry on write
+LLM_STATS_TTL_SECONDS = 60
+llm_stats_cache = TTLCache(ttl_seconds=LLM_STATS_TTL_SECONDS, max_entries=1)
+
+# Stored recommendations are immutable; a short max-age covers the expiry boundary
+RESULT_CACHE_CONTROL = "private, max-age=30"
+
+
+def _utc_now() -> Any:
+    """
+    Current UTC time computed by the database, for comparing naive UTC expires_at values.
+
+    Using the database clock avoids app/DB clock skew and keeps the statement free of a per-request bind value.
+    """
+    return func.timezone("utc", func.now())
+
+
+def _latest_result_statement() -> Any:
+    """
+    Latest recommendation for a student/course, with only the columns the result endpoint needs.
+
+    The JSON payload is selected only while the entry is still valid.
+    """
+    is_valid = LLMRecommendation.expires_at >= _utc_now()
+    return (
+        select(
+            LLMRecommendation.created_at,
+            LLMRecommendation.expires_at,
+            LLMRecommendation.data_version,
+            is_valid.label("is_valid"),
+            case((is_valid, LLMRecommendation.recommendations_json)).label("recommendations_json"),
+        )
+        .where(LLMRecommendation.student_id == bindparam("student_id"), LLMRecommendation.course_id == bindparam("course_id"))
+        .order_by(LLMRecommendation.created_at.desc())
+        .limit(1)
+    )
+
+
+# Built once; polled on every result check
+LATEST_RESULT_STMT = _latest_result_statement()
+
 
 @router.get("/recommendations/{student_id}/{course_id}")
-async def get_recommendations(
+def get_recommendations(
     student_id: str, course_id: str, force_refresh: bool = False, db: Session = Depends(get_session)
 ):
     """
@@ -66,11 +154,15 @@ async def get_recommendations(
 
 
 @router.get("/recommendations/{student_id}/{course_id}/result")
-async def get_recommendations_result(student_id: str, course_id: str, db: Session = Depends(get_session)):
+def get_recommendations_result(
+    request: Request, response: Response, student_id: str, course_id: str, db: Session = Depends(get_session)
+):
     """
     Get cached recommendations for a student in a specific course.
 
     Args:
+        request: FastAPI request object
+        response: Response whose headers are merged into the result
         student_id: Student ID
         course_id: Course ID
         db: Database session
@@ -81,25 +173,25 @@ async def get_recommendations_result(student_id: str, course_id: str, db: Sessio
     try:
         logger.info(f"Getting cached recommendations for student {student_id}, course {course_id}")
 
-        # Get latest cached recommendations
-        cached_rec = (
-            db.query(LLMRecommendation)
-            .filter(LLMRecommendation.student_id == student_id, LLMRecommendation.course_id == course_id)
-            .order_by(LLMRecommendation.created_at.desc())
-            .first()
-        )
+        cached_rec = db.execute(LATEST_RESULT_STMT, {"student_id": student_id, "course_id": course_id}).first()
 
         if not cached_rec:
             return {"status": "not_found", "message": "No recommendations found. Please generate them first."}
 
         # Check if cache is expired
-        from datetime import datetime
-
-        if cached_rec.expires_at < datetime.utcnow():
+        if not cached_rec.is_valid:
             return {"status": "expired", "message": "Recommendations have expired. Please regenerate them."}
 
+        # A recommendation never changes after it is stored, so polls that already have it skip the render
+        etag = compute_etag([student_id, course_id, cached_rec.created_at, cached_rec.expires_at, cached_rec.data_version])
+        if etag_matches(request, etag):
+            return not_modified_response(etag, RESULT_CACHE_CONTROL)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = RESULT_CACHE_CONTROL
+
         # Get recommendations
-        recommendations = cached_rec.get_recommendations()
+        recommendations = LLMRecommendation.parse_recommendations(cached_rec.recommendations_json)
 
         # Render with markdown
         rendered_recommendations = markdown_service.render_recommendations(recommendations)
@@ -108,8 +200,8 @@ async def get_recommendations_result(student_id: str, course_id: str, db: Sessio
             "status": "success",
             "recommendations": rendered_recommendations,
             "cached": True,
-            "created_at": cached_rec.created_at.isoformat(),
-            "expires_at": cached_rec.expires_at.isoformat(),
+            "created_at": cached_rec.created_at,
+            "expires_at": cached_rec.expires_at,
             "data_version": cached_rec.data_version,
         }
 
@@ -118,8 +210,39 @@ async def get_recommendations_result(student_id: str, course_id: str, db: Sessio
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _add_feedback_to_latest(db: Session, student_id: str, course_id: str, **values: Any) -> Optional[int]:
+    """
+    Attach feedback to the latest recommendation for a student/course in one INSERT ... SELECT.
+
+    Args:
+        db: Database session
+        student_id: Student ID
+        course_id: Course ID
+        **values: Remaining LLMFeedback column values
+
+    Returns:
+        ID of the recommendation the feedback was attached to, or None if there is none
+    """
+    values.update(student_id=student_id, course_id=course_id, created_at=datetime.utcnow())
+    latest_rec = (
+        select(LLMRecommendation.id, *(literal(value) for value in values.values()))
+        .where(LLMRecommendation.student_id == student_id, LLMRecommendation.course_id == course_id)
+        .order_by(LLMRecommendation.created_at.desc())
+        .limit(1)
+    )
+    statement = (
+        insert(LLMFeedback)
+        .from_select(["recommendation_id", *values], latest_rec)
+        .returning(LLMFeedback.recommendation_id)
+    )
+
+    recommendation_id = db.execute(statement).scalar_one_or_none()
+    db.commit()
+    return recommendation_id
+
+
 @router.post("/recommendations/{student_id}/{course_id}/rate")
-async def rate_recommendation(
+def rate_recommendation(
     student_id: str, course_id: str, rating_data: Dict[str, Any], db: Session = Depends(get_session)
 ):
     """
@@ -141,32 +264,22 @@ async def rate_recommendation(
         if not rating or not isinstance(rating, int) or rating < 1 or rating > 5:
             raise HTTPException(status_code=400, detail="Rating must be an integer between 1 and 5")
 
-        # Get the latest recommendation for this student/course
-        cached_rec = (
-            db.query(LLMRecommendation)
-            .filter(LLMRecommendation.student_id == student_id, LLMRecommendation.course_id == course_id)
-            .order_by(LLMRecommendation.created_at.desc())
-            .first()
-        )
-
-        if not cached_rec:
-            raise HTTPException(status_code=404, detail="No recommendations found")
-
-        # Create feedback entry
-        feedback = LLMFeedback(
-            recommendation_id=cached_rec.id,
-            student_id=student_id,
-            course_id=course_id,
+        recommendation_id = _add_feedback_to_latest(
+            db,
+            student_id,
+            course_id,
             feedback_type="student_rating",
             rating=rating,
             feedback_text=feedback_text,
             created_by="student",
         )
 
-        db.add(feedback)
-        db.commit()
+        if recommendation_id is None:
+            raise HTTPException(status_code=404, detail="No recommendations found")
 
-        logger.info(f"Student {student_id} rated recommendation {cached_rec.id} with {rating} stars")
+        llm_stats_cache.invalidate()
+
+        logger.info(f"Student {student_id} rated recommendation {recommendation_id} with {rating} stars")
 
         return {"status": "success", "message": "Rating saved successfully"}
 
@@ -178,7 +291,7 @@ async def rate_recommendation(
 
 
 @router.post("/recommendations/{student_id}/{course_id}/approve")
-async def approve_recommendation(
+def approve_recommendation(
     student_id: str, course_id: str, approval_data: Dict[str, Any], db: Session = Depends(get_session)
 ):
     """
@@ -200,33 +313,23 @@ async def approve_recommendation(
         if is_approved is None:
             raise HTTPException(status_code=400, detail="is_approved field is required")
 
-        # Get the latest recommendation for this student/course
-        cached_rec = (
-            db.query(LLMRecommendation)
-            .filter(LLMRecommendation.student_id == student_id, LLMRecommendation.course_id == course_id)
-            .order_by(LLMRecommendation.created_at.desc())
-            .first()
-        )
-
-        if not cached_rec:
-            raise HTTPException(status_code=404, detail="No recommendations found")
-
-        # Create feedback entry
-        feedback = LLMFeedback(
-            recommendation_id=cached_rec.id,
-            student_id=student_id,
-            course_id=course_id,
+        recommendation_id = _add_feedback_to_latest(
+            db,
+            student_id,
+            course_id,
             feedback_type="teacher_approval",
             is_approved=is_approved,
             edited_recommendation=edited_recommendation,
             created_by="teacher",
         )
 
-        db.add(feedback)
-        db.commit()
+        if recommendation_id is None:
+            raise HTTPException(status_code=404, detail="No recommendations found")
+
+        llm_stats_cache.invalidate()
 
         action = "approved" if is_approved else "rejected"
-        logger.info(f"Teacher {action} recommendation {cached_rec.id} for student {student_id}")
+        logger.info(f"Teacher {action} recommendation {recommendation_id} for student {student_id}")
 
         return {"status": "success", "message": f"Recommendation {action} successfully"}
 
@@ -237,112 +340,235 @@ async def approve_recommendation(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stats")
-async def get_llm_stats(db: Session = Depends(get_session)):
+@router.post("/recommendations/bulk-approve")
+def bulk_approve_recommendations(approvals: List[BulkApprovalItem], db: Session = Depends(get_session)):
     """
-    Get LLM usage statistics.
+    Teacher approval of many recommendations in one request.
+
+    Args:
+        approvals: List of recommendation IDs with approval decision and optional edited text
+        db: Database session
 
     Returns:
-        Dict with usage statistics
+        Dict with number of saved approvals and IDs that were not found
     """
     try:
-        from datetime import datetime, timedelta
+        if not approvals:
+            raise HTTPException(status_code=400, detail="No approvals provided")
+
+        # The last decision for a repeated recommendation_id wins
+        latest_items = {item.recommendation_id: item for item in approvals}
+        requested_ids = latest_items.keys()
+        owners = {
+            row.id: row
+            for row in db.execute(
+                select(LLMRecommendation.id, LLMRecommendation.student_id, LLMRecommendation.course_id).where(
+                    LLMRecommendation.id.in_(list(requested_ids))
+                )
+            )
+        }
+
+        if not owners:
+            raise HTTPException(status_code=404, detail="No recommendations found")
 
-        from sqlalchemy import func
+        # One timestamp for the batch, so ranking by created_at cannot depend on evaluation order
+        created_at = datetime.utcnow()
+        feedback_rows = [
+            {
+                "recommendation_id": item.recommendation_id,
+                "student_id": owners[item.recommendation_id].student_id,
+                "course_id": owners[item.recommendation_id].course_id,
+                "feedback_type": "teacher_approval",
+                "is_approved": item.is_approved,
+                "edited_recommendation": item.edited_recommendation,
+                "created_by": "teacher",
+                "created_at": created_at,
+            }
+            for item in latest_items.values()
+            if item.recommendation_id in owners
+        ]
+
+        # A list of parameter sets is sent as one multi-row INSERT
+        db.execute(insert(LLMFeedback), feedback_rows)
+        db.commit()
+        llm_stats_cache.invalidate()
 
-        # Get stats for the last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        missing_ids = sorted(requested_ids - owners.keys())
+        logger.info(f"Teacher bulk-approved {len(feedback_rows)} recommendations, {len(missing_ids)} not found")
 
-        # Count total recommendations
-        total_recommendations = db.query(LLMRecommendation).count()
+        return {"status": "success", "saved": len(feedback_rows), "not_found": missing_ids}
 
-        # Count active (non-expired) recommendations
-        active_recommendations = db.query(LLMRecommendation).filter(LLMRecommendation.expires_at > datetime.utcnow()).count()
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk approving recommendations: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Count feedback entries
-        total_feedback = db.query(LLMFeedback).count()
 
-        # Count student ratings
-        student_ratings = db.query(LLMFeedback).filter(LLMFeedback.feedback_type == "student_rating").count()
+def _llm_stats(db: Session) -> Dict[str, Any]:
+    """
+    Build LLM usage statistics payload.
 
-        # Count teacher approvals
-        teacher_approvals = db.query(LLMFeedback).filter(LLMFeedback.feedback_type == "teacher_approval").count()
+    Args:
+        db: Database session
 
-        # Average rating
-        avg_rating = (
-            db.query(func.avg(LLMFeedback.rating))
-            .filter(LLMFeedback.feedback_type == "student_rating", LLMFeedback.rating.isnot(None))
-            .scalar()
-            or 0
+    Returns:
+        Dict with usage statistics
+    """
+    # One pass per table with conditional aggregates instead of a query per counter
+    total_recommendations, active_recommendations = db.execute(
+        select(
+            func.count(LLMRecommendation.id),
+            func.count(LLMRecommendation.id).filter(LLMRecommendation.expires_at > _utc_now()),
+        )
+    ).one()
+
+    is_student_rating = LLMFeedback.feedback_type == "student_rating"
+    total_feedback, student_ratings, teacher_approvals, avg_rating = db.execute(
+        select(
+            func.count(LLMFeedback.id),
+            func.count(LLMFeedback.id).filter(is_student_rating),
+            func.count(LLMFeedback.id).filter(LLMFeedback.feedback_type == "teacher_approval"),
+            func.avg(LLMFeedback.rating).filter(is_student_rating),
         )
+    ).one()
 
-        return {
-            "total_recommendations": total_recommendations,
-            "active_recommendations": active_recommendations,
-            "total_feedback": total_feedback,
-            "student_ratings": student_ratings,
-            "teacher_approvals": teacher_approvals,
-            "average_rating": round(avg_rating, 2) if avg_rating else 0,
-            "period": "last_30_days",
-        }
+    return {
+        "total_recommendations": total_recommendations,
+        "active_recommendations": active_recommendations,
+        "total_feedback": total_feedback,
+        "student_ratings": student_ratings,
+        "teacher_approvals": teacher_approvals,
+        "average_rating": round(avg_rating, 2) if avg_rating else 0,
+        "period": "last_30_days",
+    }
+
+
+@router.get("/stats", response_model=LLMStatsResponse)
+def get_llm_stats(db: Session = Depends(get_session)):
+    """
+    Get LLM usage statistics.
+
+    Returns:
+        Dict with usage statistics
+    """
+    try:
+        return llm_stats_cache.get_or_set("stats", lambda: _llm_stats(db))
 
     except Exception as e:
         logger.error(f"Error getting LLM stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/teacher/recommendations")
-async def get_teacher_recommendations(
-    course_id: Optional[str] = None, status: Optional[str] = None, db: Session = Depends(get_session)
+def _latest_feedback(feedback_type: str, *columns: Any) -> Any:
+    """
+    Feedback rows of one type ranked newest first per recommendation.
+
+    Feedback is insert-only, so the row with position 1 is the current rating or decision.
+
+    Args:
+        feedback_type: LLMFeedback.feedback_type to select
+        *columns: LLMFeedback columns to expose
+
+    Returns:
+        Subquery with recommendation_id, the given columns and position
+    """
+    return (
+        select(
+            LLMFeedback.recommendation_id,
+            *columns,
+            func.row_number()
+            .over(
+                partition_by=LLMFeedback.recommendation_id,
+                order_by=(LLMFeedback.created_at.desc(), LLMFeedback.id.desc()),
+            )
+            .label("position"),
+        )
+        .where(LLMFeedback.feedback_type == feedback_type)
+        .subquery()
+    )
+
+
+@router.get("/teacher/recommendations", response_model=TeacherRecommendationsResponse)
+def get_teacher_recommendations(
+    course_id: Optional[str] = None,
+    status: Optional[str] = None,
+    rating: Optional[int] = Query(None, ge=1, le=5),
+    student: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_session),
 ):
     """
-    Get all recommendations for teacher review.
+    Get recommendations for teacher review, newest first.
 
     Args:
         course_id: Optional course ID filter
         status: Optional status filter (pending, approved, rejected)
+        rating: Optional filter on the student's latest rating
+        student: Optional case-insensitive substring of the student ID
+        limit: Page size
+        offset: Number of recommendations to skip
         db: Database session
 
     Returns:
-        Dict with recommendations and metadata
+        Dict with a page of recommendations, total matching count and course IDs for the filter
     """
     try:
         logger.info("Getting teacher recommendations")
 
-        # Build query
-        query = db.query(LLMRecommendation)
-
-        if course_id:
-            query = query.filter(LLMRecommendation.course_id == course_id)
-
-        # Get recommendations with feedback
-        recommendations = query.order_by(LLMRecommendation.created_at.desc()).all()
+        # Latest feedback of each type per recommendation, joined so the whole page is one query
+        student_feedback = _latest_feedback("student_rating", LLMFeedback.rating)
+        teacher_feedback = _latest_feedback("teacher_approval", LLMFeedback.is_approved)
+        teacher_status = case(
+            (teacher_feedback.c.recommendation_id.is_(None), "pending"),
+            (teacher_feedback.c.is_approved.is_(True), "approved"),
+            else_="rejected",
+        )
 
-        result = []
-        for rec in recommendations:
-            # Get student feedback
-            student_feedback = (
-                db.query(LLMFeedback)
-                .filter(LLMFeedback.recommendation_id == rec.id, LLMFeedback.feedback_type == "student_rating")
-                .first()
+        query = (
+            select(LLMRecommendation, student_feedback.c.rating, teacher_status.label("teacher_status"))
+            .outerjoin(
+                student_feedback,
+                (student_feedback.c.recommendation_id == LLMRecommendation.id) & (student_feedback.c.position == 1),
             )
-
-            # Get teacher feedback
-            teacher_feedback = (
-                db.query(LLMFeedback)
-                .filter(LLMFeedback.recommendation_id == rec.id, LLMFeedback.feedback_type == "teacher_approval")
-                .first()
+            .outerjoin(
+                teacher_feedback,
+                (teacher_feedback.c.recommendation_id == LLMRecommendation.id) & (teacher_feedback.c.position == 1),
             )
+        )
 
-            # Determine teacher status
-            teacher_status = "pending"
-            if teacher_feedback:
-                teacher_status = "approved" if teacher_feedback.is_approved else "rejected"
-
-            # Apply status filter
-            if status and teacher_status != status:
-                continue
+        if course_id:
+            query = query.where(LLMRecommendation.course_id == course_id)
+
+        if status:
+            query = query.where(teacher_status == status)
+
+        if rating:
+            query = query.where(student_feedback.c.rating == rating)
+
+        if student:
+            query = query.where(LLMRecommendation.student_id.icontains(student, autoescape=True))
+
+        # COUNT(*) OVER() returns the total with the page rows
+        rows = db.execute(
+            query.add_columns(func.count().over().label("total_count"))
+            # id breaks created_at ties so pages do not overlap
+            .order_by(LLMRecommendation.created_at.desc(), LLMRecommendation.id.desc())
+            .limit(limit)
+            .offset(offset)
+        ).all()
+
+        # A separate count is only needed past the last page
+        if rows:
+            total = rows[0].total_count
+        elif offset:
+            total = db.execute(select(func.count()).select_from(query.subquery())).scalar() or 0
+        else:
+            total = 0
 
+        result = []
+        for rec, student_rating, rec_status, _ in rows:
             # Render recommendations with markdown
             recommendations_list = rec.get_recommendations()
             rendered_recommendations = markdown_service.render_recommendations(recommendations_list)
@@ -355,14 +581,27 @@ async def get_teacher_recommendations(
                     "course_name": f"Курс {rec.course_id}",  # TODO: Get actual course name
                     "text_content": recommendations_list[0] if recommendations_list else "",
                     "html_content": rendered_recommendations[0]["html"] if rendered_recommendations else "",
-                    "student_rating": student_feedback.rating if student_feedback else None,
-                    "teacher_status": teacher_status,
-                    "created_at": rec.created_at.isoformat(),
-                    "expires_at": rec.expires_at.isoformat(),
+                    "student_rating": student_rating,
+                    "teacher_status": rec_status,
+                    "created_at": rec.created_at,
+                    "expires_at": rec.expires_at,
                 }
             )
 
-        return {"status": "success", "recommendations": result, "total": len(result)}
+        # Course filter options cover every page, not just the loaded one
+        courses = list(
+            db.execute(select(LLMRecommendation.course_id).distinct().order_by(LLMRecommendation.course_id)).scalars()
+        )
+
+        return {
+            "status": "success",
+            "recommendations": result,
+            "total": total,
+            "has_more": offset + len(result) < total,
+            "limit": limit,
+            "offset": offset,
+            "courses": courses,
+        }
 
     except Exception as e:
         logger.error(f"Error getting teacher recommendations: {e}")
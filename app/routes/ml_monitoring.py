@@ -3,23 +3,63 @@ ML monitoring API routes for clustering quality tracking.
 """
 
 import logging
-from typing import Any, Dict, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.middleware.auth import require_admin
+from app.services.cache_service import TTLCache
+from app.services.etag_service import compute_etag, etag_matches, not_modified_response
 from app.services.ml_monitoring_service import MLMonitoringService
 
+
+class ClusterMember(BaseModel):
+    student_id: str
+    cluster_score: float
+    attendance_rate: float
+    completion_rate: float
+    overall_progress: float
+
+
+class ClusterSummary(BaseModel):
+    count: int
+    avg_attendance: float
+    avg_completion: float
+    avg_progress: float
+
+
+class StudentClustersResponse(BaseModel):
+    status: str
+    total_students: int
+    cluster_groups: Dict[str, List[ClusterMember]]
+    cluster_summary: Dict[str, ClusterSummary]
+    last_clustering_time: Optional[datetime]
+
+
 logger = logging.getLogger("app.ml_monitoring")
-router = APIRouter(prefix="/api/ml-monitoring", tags=["ml-monitoring"])
+# orjson serializes the datetimes in quality metrics and alerts natively
+router = APIRouter(prefix="/api/ml-monitoring", tags=["ml-monitoring"], default_response_class=ORJSONResponse)
 
 monitoring_service = MLMonitoringService()
 
+# Quality metrics only change when a clustering run finishes
+QUALITY_REPORT_TTL_SECONDS = 60
+quality_history_cache = TTLCache(ttl_seconds=QUALITY_REPORT_TTL_SECONDS, max_entries=256)
+performance_summary_cache = TTLCache(ttl_seconds=QUALITY_REPORT_TTL_SECONDS, max_entries=32)
+
+THRESHOLDS_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get("/course/{course_id}/quality-history")
-async def get_course_quality_history(
+def get_course_quality_history(
     course_id: int,
     days: int = Query(default=30, ge=1, le=365, description="Number of days to look back"),
     db: Session = Depends(get_session),
@@ -37,7 +77,9 @@ async def get_course_quality_history(
         Quality metrics history
     """
     try:
-        history = monitoring_service.get_course_quality_history(course_id, days, db)
+        history = quality_history_cache.get_or_set(
+            (course_id, days), lambda: monitoring_service.get_course_quality_history(course_id, days, db)
+        )
 
         return {
             "status": "success",
@@ -53,7 +95,7 @@ async def get_course_quality_history(
 
 
 @router.get("/performance-summary")
-async def get_algorithm_performance_summary(
+def get_algorithm_performance_summary(
     days: int = Query(default=30, ge=1, le=365, description="Number of days to look back"),
     db: Session = Depends(get_session),
     # _: None = Depends(require_admin)  # Temporarily disabled for testing
@@ -69,7 +111,9 @@ async def get_algorithm_performance_summary(
         Algorithm performance summary
     """
     try:
-        summary = monitoring_service.get_algorithm_performance_summary(days, db)
+        summary = performance_summary_cache.get_or_set(
+            days, lambda: monitoring_service.get_algorithm_performance_summary(days, db)
+        )
 
         return {"status": "success", "performance_summary": summary, "period_days": days}
 
@@ -79,7 +123,7 @@ async def get_algorithm_performance_summary(
 
 
 @router.get("/alerts")
-async def get_active_alerts(
+def get_active_alerts(
     course_id: Optional[int] = Query(default=None, description="Filter by course ID"),
     db: Session = Depends(get_session),
     # _: None = Depends(require_admin)  # Temporarily disabled for testing
@@ -113,7 +157,7 @@ async def get_active_alerts(
 
 
 @router.post("/alerts/{alert_id}/resolve")
-async def resolve_alert(
+def resolve_alert(
     alert_id: int,
     resolution_notes: str,
     db: Session = Depends(get_session),
@@ -150,17 +194,31 @@ async def resolve_alert(
 
 @router.get("/thresholds")
 async def get_quality_thresholds(
+    request: Request,
+    response: Response,
     # _: None = Depends(require_admin)  # Temporarily disabled for testing
 ) -> Dict[str, Any]:
     """
     Get current quality thresholds.
 
+    Args:
+        request: FastAPI request object
+        response: Response whose headers are merged into the result
+
     Returns:
         Current quality thresholds
     """
     try:
         thresholds = monitoring_service.get_quality_thresholds()
 
+        # Thresholds can be updated at any time, so clients always revalidate
+        etag = compute_etag(thresholds)
+        if etag_matches(request, etag):
+            return not_modified_response(etag, THRESHOLDS_CACHE_CONTROL)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = THRESHOLDS_CACHE_CONTROL
+
         return {"status": "success", "thresholds": thresholds}
 
     except Exception as e:
@@ -203,7 +261,7 @@ async def update_quality_thresholds(
 
 
 @router.get("/course/{course_id}/monitoring-report")
-async def get_course_monitoring_report(
+def get_course_monitoring_report(
     course_id: int,
     days: int = Query(default=30, ge=1, le=365, description="Number of days to look back"),
     db: Session = Depends(get_session),
@@ -221,14 +279,18 @@ async def get_course_monitoring_report(
         Comprehensive monitoring report
     """
     try:
-        # Get quality history
-        quality_history = monitoring_service.get_course_quality_history(course_id, days, db)
+        # Get quality history (shared with the quality-history endpoint cache)
+        quality_history = quality_history_cache.get_or_set(
+            (course_id, days), lambda: monitoring_service.get_course_quality_history(course_id, days, db)
+        )
 
         # Get active alerts for this course
         active_alerts = monitoring_service.get_active_alerts(course_id, db)
 
-        # Get algorithm performance summary
-        performance_summary = monitoring_service.get_algorithm_performance_summary(days, db)
+        # Get algorithm performance summary (shared with the performance-summary endpoint cache)
+        performance_summary = performance_summary_cache.get_or_set(
+            days, lambda: monitoring_service.get_algorithm_performance_summary(days, db)
+        )
 
         # Calculate summary statistics
         total_runs = len(quality_history)
@@ -249,8 +311,8 @@ async def get_course_monitoring_report(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/student-clusters")
-async def get_student_clusters(
+@router.get("/student-clusters", response_model=StudentClustersResponse)
+def get_student_clusters(
     course_id: Optional[int] = Query(default=None, description="Filter by course ID"),
     db: Session = Depends(get_session),
     # _: None = Depends(require_admin)  # Temporarily disabled for testing
@@ -267,53 +329,60 @@ async def get_student_clusters(
     """
     try:
         from app.models.cluster import StudentCluster
-        from app.models.student import Student
-
-        # Get cluster assignments
-        query = db.query(StudentCluster)
-        if course_id:
-            query = query.filter(StudentCluster.course_id == course_id)
-
-        clusters = query.all()
-
-        # Group by cluster label
-        cluster_groups = {}
-        for cluster in clusters:
-            label = cluster.cluster_label
-            if label not in cluster_groups:
-                cluster_groups[label] = []
-            cluster_groups[label].append(
-                {
-                    "student_id": cluster.student_id,
-                    "cluster_score": cluster.cluster_score,
-                    "attendance_rate": cluster.attendance_rate,
-                    "completion_rate": cluster.completion_rate,
-                    "overall_progress": cluster.overall_progress,
-                }
-            )
 
-        # Calculate summary statistics
-        total_students = len(clusters)
-        cluster_summary = {}
-        for label, students in cluster_groups.items():
-            cluster_summary[label] = {
-                "count": len(students),
-                "avg_attendance": sum(s["attendance_rate"] for s in students) / len(students) if students else 0,
-                "avg_completion": sum(s["completion_rate"] for s in students) / len(students) if students else 0,
-                "avg_progress": sum(s["overall_progress"] for s in students) / len(students) if students else 0,
+        course_filter = [StudentCluster.course_id == course_id] if course_id else []
+
+        # Per-cluster averages are computed by the database
+        summary_rows = db.execute(
+            select(
+                StudentCluster.cluster_label,
+                func.count().label("count"),
+                func.avg(StudentCluster.attendance_rate).label("avg_attendance"),
+                func.avg(StudentCluster.completion_rate).label("avg_completion"),
+                func.avg(StudentCluster.overall_progress).label("avg_progress"),
+                func.max(StudentCluster.created_at).label("last_created_at"),
+            )
+            .where(*course_filter)
+            .group_by(StudentCluster.cluster_label)
+        ).all()
+
+        cluster_summary = {
+            row.cluster_label: {
+                "count": row.count,
+                "avg_attendance": row.avg_attendance,
+                "avg_completion": row.avg_completion,
+                "avg_progress": row.avg_progress,
             }
+            for row in summary_rows
+        }
+        total_students = sum(row.count for row in summary_rows)
+        last_clustering_time = max((row.last_created_at for row in summary_rows), default=None)
+
+        # Student listing, ordered so rows of one cluster are contiguous
+        student_rows = db.execute(
+            select(
+                StudentCluster.cluster_label,
+                StudentCluster.student_id,
+                StudentCluster.cluster_score,
+                StudentCluster.attendance_rate,
+                StudentCluster.completion_rate,
+                StudentCluster.overall_progress,
+            )
+            .where(*course_filter)
+            .order_by(StudentCluster.cluster_label)
+        ).mappings()
 
-        # Get last clustering time
-        last_clustering_time = None
-        if clusters:
-            last_clustering_time = max(cluster.created_at for cluster in clusters)
+        cluster_groups = {
+            label: [{key: value for key, value in row.items() if key != "cluster_label"} for row in rows]
+            for label, rows in groupby(student_rows, key=itemgetter("cluster_label"))
+        }
 
         return {
             "status": "success",
             "total_students": total_students,
             "cluster_groups": cluster_groups,
             "cluster_summary": cluster_summary,
-            "last_clustering_time": last_clustering_time.isoformat() if last_clustering_time else None,
+            "last_clustering_time": last_clustering_time,
         }
 
     except Exception as e:
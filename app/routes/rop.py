@@ -8,18 +8,16 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.models.student import Attendance, Course, Student, Task, TaskCompletion
 from app.services.rop_service import ROPService
+from app.ui.templating import templates
 
 router = APIRouter(prefix="/rop", tags=["rop"])
 logger = logging.getLogger("app.rop")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
 
 # Initialize ROP service
 rop_service = ROPService()
@@ -37,7 +35,7 @@ async def rop_dashboard(request: Request, db: Session = Depends(get_session)) ->
     Returns:
         HTML response with ROP dashboard
     """
-    logger.info("ROP dashboard requested")
+    logger.debug("ROP dashboard requested")
 
     try:
         # Get ROP dashboard data
@@ -70,7 +68,7 @@ async def course_analytics(course_id: int, request: Request, db: Session = Depen
     Returns:
         HTML response with course analytics
     """
-    logger.info(f"Course analytics requested for course: {course_id}")
+    logger.debug(f"Course analytics requested for course: {course_id}")
 
     try:
         # Get course
@@ -111,7 +109,7 @@ async def get_rop_dashboard_api(db: Session = Depends(get_session)) -> Dict[str,
     Returns:
         JSON with ROP dashboard data
     """
-    logger.info("ROP dashboard API requested")
+    logger.debug("ROP dashboard API requested")
 
     try:
         dashboard_data = rop_service.get_rop_dashboard(db)
@@ -134,7 +132,7 @@ async def get_trends_api(days: int, db: Session = Depends(get_session)) -> Dict[
     Returns:
         JSON with trends data
     """
-    logger.info(f"Trends API requested for {days} days")
+    logger.debug(f"Trends API requested for {days} days")
 
     try:
         if days not in [7, 30]:
@@ -163,7 +161,7 @@ async def get_course_trends_api(course_id: int, days: int, db: Session = Depends
     Returns:
         JSON with course trends data
     """
-    logger.info(f"Course trends API requested for course {course_id}, {days} days")
+    logger.debug(f"Course trends API requested for course {course_id}, {days} days")
 
     try:
         trends_data = rop_service.get_course_trends(course_id, days, db)
@@ -186,7 +184,7 @@ async def rop_programs(request: Request, db: Session = Depends(get_session)) ->
     Returns:
         HTML response with ROP programs
     """
-    logger.info("ROP programs page requested")
+    logger.debug("ROP programs page requested")
 
     try:
         # Get ROP programs data
@@ -213,7 +211,7 @@ async def rop_trends(request: Request, db: Session = Depends(get_session)) -> HT
     Returns:
         HTML response with ROP trends
     """
-    logger.info("ROP trends page requested")
+    logger.debug("ROP trends page requested")
 
     try:
         # Get ROP trends data
@@ -256,7 +254,7 @@ async def rop_quality(request: Request, db: Session = Depends(get_session)) -> H
     Returns:
         HTML response with ROP quality
     """
-    logger.info("ROP quality page requested")
+    logger.debug("ROP quality page requested")
 
     try:
         # Get ROP quality data
@@ -8,18 +8,16 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.database.session import get_session
 from app.models.student import Attendance, Course, Student, Task, TaskCompletion
 from app.services.student_service import StudentService
+from app.ui.templating import templates
 
 router = APIRouter(prefix="/student", tags=["student"])
 logger = logging.getLogger("app.student")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
 
 # Initialize student service
 student_service = StudentService()
@@ -40,7 +38,7 @@ async def student_dashboard(
     Returns:
         HTML response with student dashboard
     """
-    logger.info(f"Student dashboard requested for student: {student_id}")
+    logger.debug(f"Student dashboard requested for student: {student_id}")
 
     try:
         # Get student data
@@ -87,7 +85,7 @@ async def student_courses(
     Returns:
         HTML response with student courses
     """
-    logger.info(f"Student courses requested for student: {student_id}")
+    logger.debug(f"Student courses requested for student: {student_id}")
 
     try:
         # Get student data
@@ -125,7 +123,7 @@ async def student_progress(
     Returns:
         HTML response with student progress page
     """
-    logger.info(f"Student progress page requested for student: {student_id}")
+    logger.debug(f"Student progress page requested for student: {student_id}")
 
     try:
         # Get student data
@@ -170,7 +168,7 @@ async def student_assignments(
     Returns:
         HTML response with student assignments
     """
-    logger.info(f"Student assignments page requested for student: {student_id}")
+    logger.debug(f"Student assignments page requested for student: {student_id}")
 
     try:
         # Get student data
@@ -215,7 +213,7 @@ async def student_schedule(
     Returns:
         HTML response with student schedule
     """
-    logger.info(f"Student schedule page requested for student: {student_id}")
+    logger.debug(f"Student schedule page requested for student: {student_id}")
 
     try:
         # Get student data
@@ -260,7 +258,7 @@ async def student_recommendations(
     Returns:
         HTML response with student recommendations
     """
-    logger.info(f"Student recommendations page requested for student: {student_id}")
+    logger.debug(f"Student recommendations page requested for student: {student_id}")
 
     try:
         # Get student data
@@ -309,7 +307,7 @@ async def student_course_details(
     Returns:
         HTML response with course details
     """
-    logger.info(f"Student course details requested for student: {student_id}, course: {course_id}")
+    logger.debug(f"Student course details requested for student: {student_id}, course: {course_id}")
 
     try:
         # Get student data
@@ -349,7 +347,7 @@ async def get_student_progress_api(student_id: str, db: Session = Depends(get_se
     Returns:
         JSON with student progress data
     """
-    logger.info(f"Student progress API requested for student: {student_id}")
+    logger.debug(f"Student progress API requested for student: {student_id}")
 
     try:
         progress_data = student_service.get_student_progress(student_id, db)
@@ -8,7 +8,6 @@ from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session
 
@@ -17,12 +16,11 @@ from app.models.student import Attendance, Course, Lesson, Student, Task, TaskCo
 from app.services.cluster_service import ClusterService
 from app.services.rbac_service import RBACService
 from app.services.teacher_service import TeacherService
+from app.ui.templating import templates
 
 router = APIRouter(prefix="/teacher", tags=["teacher"])
 logger = logging.getLogger("app.teacher")
 
-# Templates
-templates = Jinja2Templates(directory="app/ui/templates")
 
 # Initialize services
 teacher_service = TeacherService()
@@ -42,7 +40,7 @@ async def teacher_dashboard(request: Request, db: Session = Depends(get_session)
     Returns:
         HTML response with teacher dashboard
     """
-    logger.info("Teacher dashboard requested")
+    logger.debug("Teacher dashboard requested")
 
     try:
         # Get teacher dashboard data
@@ -75,7 +73,7 @@ async def course_details(course_id: int, request: Request, db: Session = Depends
     Returns:
         HTML response with course details
     """
-    logger.info(f"Course details requested for course: {course_id}")
+    logger.debug(f"Course details requested for course: {course_id}")
 
     try:
         # Get course information
@@ -199,7 +197,7 @@ async def get_teacher_dashboard_api(db: Session = Depends(get_session)) -> Dict[
     Returns:
         JSON with teacher dashboard data
     """
-    logger.info("Teacher dashboard API requested")
+    logger.debug("Teacher dashboard API requested")
 
     try:
         dashboard_data = teacher_service.get_teacher_dashboard(db)
@@ -222,7 +220,7 @@ async def get_course_details_api(course_id: int, db: Session = Depends(get_sessi
     Returns:
         JSON with course details
     """
-    logger.info(f"Course details API requested for course: {course_id}")
+    logger.debug(f"Course details API requested for course: {course_id}")
 
     try:
         course_data = teacher_service.get_course_details(course_id, db)
@@ -245,7 +243,7 @@ async def get_course_clusters_api(course_id: int, db: Session = Depends(get_sess
     Returns:
         JSON with course clusters
     """
-    logger.info(f"Course clusters API requested for course: {course_id}")
+    logger.debug(f"Course clusters API requested for course: {course_id}")
 
     try:
         clusters = cluster_service.get_course_clusters(course_id, db)
@@ -289,7 +287,7 @@ async def teacher_recommendations(request: Request, db: Session = Depends(get_se
     Returns:
         HTML response with recommendations management page
     """
-    logger.info("Teacher recommendations page requested")
+    logger.debug("Teacher recommendations page requested")
 
     try:
         return templates.TemplateResponse(
@@ -313,7 +311,7 @@ async def teacher_courses(request: Request, db: Session = Depends(get_session))
     Returns:
         HTML response with teacher courses
     """
-    logger.info("Teacher courses page requested")
+    logger.debug("Teacher courses page requested")
 
     try:
         # Get teacher courses data
@@ -340,7 +338,7 @@ async def teacher_students(request: Request, db: Session = Depends(get_session))
     Returns:
         HTML response with teacher students
     """
-    logger.info("Teacher students page requested")
+    logger.debug("Teacher students page requested")
 
     try:
         # Get teacher students data
@@ -368,7 +366,7 @@ async def teacher_analytics(request: Request, db: Session = Depends(get_session)
     Returns:
         HTML response with teacher analytics
     """
-    logger.info("Teacher analytics page requested")
+    logger.debug("Teacher analytics page requested")
 
     try:
         # Get teacher analytics data
@@ -410,7 +408,7 @@ async def teacher_assignments(request: Request, db: Session = Depends(get_sessio
     Returns:
         HTML response with teacher assignments
     """
-    logger.info("Teacher assignments page requested")
+    logger.debug("Teacher assignments page requested")
 
     try:
         # Get teacher assignments data
@@ -446,7 +444,7 @@ async def teacher_schedule(request: Request, db: Session = Depends(get_session))
     Returns:
         HTML response with teacher schedule
     """
-    logger.info("Teacher schedule page requested")
+    logger.debug("Teacher schedule page requested")
 
     try:
         # Get teacher schedule data
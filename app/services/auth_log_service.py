@@ -0,0 +1,157 @@
+"""
+Buffered writer for authentication audit log.
+"""
+
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.database.session import get_db_session
+from app.models.user import UserAuthLog
+
+logger = logging.getLogger("app.auth_log")
+
+
+class AuthLogService:
+    """Collects auth attempts in memory and writes them to user_auth_log in batches."""
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 1.0, max_pending: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # None is the stop sentinel for the writer thread
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def record(
+        self,
+        login: str,
+        outcome: str,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        user_id: Optional[str] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Queue an auth attempt for the next batch write.
+
+        Args:
+            login: User login
+            outcome: 'success' or 'fail'
+            ip_address: Client IP address
+            user_agent: Client user agent
+            user_id: User ID if successful
+            reason: Failure reason if failed
+        """
+        self._ensure_writer()
+
+        entry = {
+            "ts": datetime.utcnow(),
+            "login": login,
+            "outcome": outcome,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "user_id": user_id,
+            "reason": reason,
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            logger.warning(f"Auth log buffer full, dropping entry: {login} - {outcome}")
+
+    def flush(self, timeout: float = 10.0) -> int:
+        """
+        Stop the writer thread and write every pending entry (used on shutdown).
+
+        The writer finishes the batch it is collecting before it exits, so entries
+        already taken off the queue are not lost.
+
+        Args:
+            timeout: Seconds to wait for the writer thread to finish
+
+        Returns:
+            Number of entries written by this call after the writer stopped
+        """
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("Auth log writer did not stop in time, writing remaining entries from the caller")
+
+        written = 0
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return written
+            self._write(batch)
+            written += len(batch)
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._thread is not None:
+            return
+
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="auth-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Write a batch once it is full or flush_interval has passed since its first entry; exit on the stop sentinel."""
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+
+            batch = [entry]
+            stopping = False
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._write(batch)
+            if stopping:
+                return
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """Pop up to limit pending entries without blocking."""
+        batch = []
+        while len(batch) < limit:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                batch.append(entry)
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of entries as one multi-row INSERT with a single commit."""
+        try:
+            with get_db_session() as db:
+                # Plain mappings skip ORM object construction and identity tracking
+                db.bulk_insert_mappings(UserAuthLog, batch)
+            logger.debug(f"Auth log batch written: {len(batch)} entries")
+        except Exception as e:
+            logger.error(f"Failed to write auth log batch of {len(batch)} entries: {e}")
+
+
+# Global auth log service instance
+auth_log_service = AuthLogService()
@@ -0,0 +1,102 @@
+"""
+In-process TTL cache for short-lived, near-static lookups.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("app.cache")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe in-memory cache where every entry expires after a fixed TTL."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value if it has not expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value for the configured TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._evict_expired()
+                if len(self._entries) >= self.max_entries:
+                    # Drop the oldest inserted entry
+                    self._entries.pop(next(iter(self._entries)))
+
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Get cached value or compute, cache and return it.
+
+        Args:
+            key: Cache key
+            factory: Callable producing the value on miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = factory()
+        self.set(key, value)
+        logger.debug(f"Cache miss for {key}, value stored for {self.ttl_seconds}s")
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop a single key, or every entry when key is None.
+
+        Args:
+            key: Cache key to drop (optional)
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _evict_expired(self) -> None:
+        """Remove expired entries. Caller must hold the lock."""
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
@@ -5,18 +5,26 @@ Configuration service for reading settings from environment and database.
 import logging
 import os
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from app.models.admin import AdminSetting
+from app.services.cache_service import TTLCache
 
 logger = logging.getLogger("app.config")
 
+_MISSING = object()
+
 
 class ConfigService:
     """Service for managing application configuration."""
 
+    # How long looked-up settings are served from memory
+    CACHE_TTL_SECONDS = 30
+
     def __init__(self):
-        self._cache: dict[str, Any] = {}
+        # Values set from the admin panel (until settings are stored in DB)
+        self._overrides: dict[str, Any] = {}
+        self._cache = TTLCache(ttl_seconds=self.CACHE_TTL_SECONDS, max_entries=128)
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -24,28 +32,46 @@ class ConfigService:
 
         Priority: Database > Environment > Default
         """
-        # First check cache
-        if key in self._cache:
-            return self._cache[key]
+        if key in self._overrides:
+            return self._overrides[key]
+
+        # First check cache (keyed with default, as env lookups fall back to it)
+        cache_key = (key, default)
+        value = self._cache.get(cache_key, _MISSING)
+        if value is not _MISSING:
+            return value
 
         # Try database first (will be implemented when DB is ready)
         # For now, fall back to environment
         value = os.getenv(key, default)
 
         # Cache the result
-        self._cache[key] = value
+        self._cache.set(cache_key, value)
 
         logger.debug(f"Retrieved setting {key}={value}")
         return value
 
+    def get_settings(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get several settings at once.
+
+        Args:
+            defaults: Mapping of setting keys to default values
+
+        Returns:
+            Mapping of setting keys to current values
+        """
+        return {key: self.get_setting(key, default) for key, default in defaults.items()}
+
     def set_setting(self, key: str, value: str, description: Optional[str] = None) -> None:
         """
         Set setting value in database.
 
         This will be implemented when database is ready.
         """
-        # For now, just update cache
-        self._cache[key] = value
+        # For now, just keep the value in memory
+        self._overrides[key] = value
+        self._cache.invalidate()
         logger.info(f"Set setting {key}={value}")
 
     def now(self) -> datetime:
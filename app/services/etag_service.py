@@ -0,0 +1,55 @@
+"""
+ETag helpers for conditional GET on polled pages.
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def compute_etag(payload: Any) -> str:
+    """
+    Build a weak ETag from the data a page is rendered from.
+
+    Args:
+        payload: JSON-serializable data (non-JSON values are converted with str)
+
+    Returns:
+        Weak ETag header value
+    """
+    body = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check If-None-Match header against ETag using weak comparison.
+
+    Args:
+        request: FastAPI request object
+        etag: Current ETag of the resource
+
+    Returns:
+        True if client already has this version
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str, cache_control: Optional[str] = None) -> Response:
+    """Empty 304 response carrying the current ETag and, optionally, Cache-Control."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
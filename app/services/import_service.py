@@ -5,9 +5,10 @@ Import service for processing Excel files.
 import json
 import logging
 import os
+import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 
 import pandas as pd
 from sqlalchemy.orm import Session
@@ -19,6 +20,8 @@ from app.services.learning_import_service import LearningImportService
 
 logger = logging.getLogger("app.import")
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class ImportService:
     """Service for processing Excel import jobs."""
@@ -226,12 +229,12 @@ class ImportService:
             logger.error(f"Failed to log import error: {e}")
             db.rollback()
 
-    def save_uploaded_file(self, file_content: bytes, filename: str) -> str:
+    def save_uploaded_file(self, source: BinaryIO, filename: str) -> str:
         """
-        Save uploaded file to disk.
+        Stream uploaded file to disk.
 
         Args:
-            file_content: File content as bytes
+            source: Binary file object to copy from
             filename: Original filename
 
         Returns:
@@ -244,8 +247,12 @@ class ImportService:
 
         file_path = self.upload_dir / unique_filename
 
+        # Copy in fixed-size chunks so the whole upload is never held in memory
         with open(file_path, "wb") as f:
-            f.write(file_content)
+            shutil.copyfileobj(source, f, length=UPLOAD_CHUNK_SIZE)
+            f.flush()
+            # The import worker reads this file from another process right after the job is queued
+            os.fsync(f.fileno())
 
         logger.info(f"File saved: {file_path}")
         return str(file_path)
@@ -2,7 +2,9 @@
 Markdown rendering service with sanitization for LLM recommendations.
 """
 
+import functools
 import logging
+import threading
 from typing import Any, Dict, List
 
 import bleach
@@ -10,6 +12,9 @@ import markdown
 
 logger = logging.getLogger("app.markdown")
 
+# Rendered HTML kept per distinct recommendation text
+RENDER_CACHE_SIZE = 2048
+
 
 class MarkdownService:
     def __init__(self):
@@ -70,6 +75,17 @@ class MarkdownService:
 
         self.allowed_protocols = ["http", "https", "mailto"]
 
+        # Markdown instances keep parser state between convert() calls
+        self._md_lock = threading.Lock()
+        self._render_html = functools.lru_cache(maxsize=RENDER_CACHE_SIZE)(self._to_html)
+
+    def _to_html(self, text: str) -> str:
+        """Convert markdown to sanitized HTML."""
+        with self._md_lock:
+            html = self.md.convert(text)
+
+        return bleach.clean(html, tags=self.allowed_tags, attributes=self.allowed_attributes, protocols=self.allowed_protocols)
+
     def render_recommendations(self, recommendations: List[str]) -> List[Dict[str, Any]]:
         """
         Render a list of recommendations with markdown support.
@@ -84,13 +100,8 @@ class MarkdownService:
 
         for i, recommendation in enumerate(recommendations):
             try:
-                # Convert markdown to HTML
-                html = self.md.convert(recommendation)
-
-                # Sanitize HTML
-                clean_html = bleach.clean(
-                    html, tags=self.allowed_tags, attributes=self.allowed_attributes, protocols=self.allowed_protocols
-                )
+                # Same text always renders to the same HTML, so it is memoized
+                clean_html = self._render_html(recommendation)
 
                 rendered.append(
                     {"id": i + 1, "text": recommendation, "html": clean_html, "preview": self._create_preview(recommendation)}
@@ -121,13 +132,7 @@ class MarkdownService:
             Dict with 'text' and 'html' keys
         """
         try:
-            # Convert markdown to HTML
-            html = self.md.convert(recommendation)
-
-            # Sanitize HTML
-            clean_html = bleach.clean(
-                html, tags=self.allowed_tags, attributes=self.allowed_attributes, protocols=self.allowed_protocols
-            )
+            clean_html = self._render_html(recommendation)
 
             return {"text": recommendation, "html": clean_html, "preview": self._create_preview(recommendation)}
 
@@ -186,7 +191,8 @@ class MarkdownService:
         """
         try:
             # Try to convert markdown
-            html = self.md.convert(text)
+            with self._md_lock:
+                html = self.md.convert(text)
 
             # Check for potentially dangerous content
             dangerous_patterns = [r"<script[^>]*>", r"javascript:", r"data:text/html", r"vbscript:", r"on\w+\s*="]
@@ -0,0 +1,73 @@
+"""
+Long-lived RabbitMQ connection for health probes.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+import pika
+from pika.exceptions import AMQPError
+
+logger = logging.getLogger("app.rabbitmq")
+
+
+class RabbitMQConnectionPool:
+    """Keeps one BlockingConnection open so status probes skip the AMQP handshake."""
+
+    def __init__(self, url: Optional[str] = None):
+        self.url = url or os.getenv("RABBITMQ_URL", "amqp://pulseedu:pulseedu@mq:5672//")
+        self._connection: Optional[pika.BlockingConnection] = None
+        # BlockingConnection is not thread-safe
+        self._lock = threading.Lock()
+
+    def ping(self) -> float:
+        """
+        Check the broker over the shared connection, reconnecting once if it was dropped.
+
+        Returns:
+            Round-trip time in milliseconds
+
+        Raises:
+            AMQPError: If the broker cannot be reached
+        """
+        with self._lock:
+            reused = self._connection is not None and self._connection.is_open
+            try:
+                return self._ping()
+            except AMQPError as e:
+                self._close()
+                if not reused:
+                    raise
+                # The broker dropped an idle connection, one fresh attempt
+                logger.info(f"RabbitMQ connection lost, reconnecting: {e}")
+                return self._ping()
+
+    def close(self) -> None:
+        """Close the shared connection (used on shutdown)."""
+        with self._lock:
+            self._close()
+
+    def _ping(self) -> float:
+        """Open the connection if needed and service pending I/O. Caller must hold the lock."""
+        start_time = time.perf_counter()
+        if self._connection is None or self._connection.is_closed:
+            self._connection = pika.BlockingConnection(pika.URLParameters(self.url))
+        # Handles heartbeats and raises if the broker closed the connection
+        self._connection.process_data_events(time_limit=0)
+        return round((time.perf_counter() - start_time) * 1000, 2)
+
+    def _close(self) -> None:
+        """Drop the connection, ignoring errors from an already dead socket. Caller must hold the lock."""
+        if self._connection is not None and self._connection.is_open:
+            try:
+                self._connection.close()
+            except AMQPError:
+                pass
+        self._connection = None
+
+
+# Global RabbitMQ connection pool instance
+rabbitmq_pool = RabbitMQConnectionPool()
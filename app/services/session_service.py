@@ -127,12 +127,12 @@ class SessionService:
             True if session destroyed, False otherwise
         """
         try:
-            if session_token in self._sessions:
-                user_login = self._sessions[session_token].get("login", "unknown")
-                del self._sessions[session_token]
-                self.logger.info(f"Destroyed session for user {user_login}")
-                return True
-            return False
+            session_data = self._sessions.pop(session_token, None)
+            if session_data is None:
+                return False
+
+            self.logger.info(f"Destroyed session for user {session_data.get('login', 'unknown')}")
+            return True
 
         except Exception as e:
             self.logger.error(f"Error destroying session: {e}")
@@ -0,0 +1 @@
+# UI package
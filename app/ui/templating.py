@@ -0,0 +1,37 @@
+"""
+Shared Jinja2 templates for HTML routes.
+"""
+
+import logging
+import os
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+logger = logging.getLogger("app.templates")
+
+TEMPLATES_DIR = "app/ui/templates"
+
+
+def create_templates() -> Jinja2Templates:
+    """
+    Create templates with a bytecode cache shared across worker processes.
+
+    Returns:
+        Configured Jinja2Templates instance
+    """
+    templates = Jinja2Templates(directory=TEMPLATES_DIR)
+
+    cache_dir = os.getenv("TEMPLATES_CACHE_DIR", "/tmp/pulseedu_jinja_cache")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        templates.env.bytecode_cache = FileSystemBytecodeCache(directory=cache_dir)
+    except OSError as e:
+        logger.warning(f"Template bytecode cache disabled, {cache_dir} is not writable: {e}")
+
+    # Skip stat() of every template on each render unless templates are edited live
+    templates.env.auto_reload = os.getenv("TEMPLATES_AUTO_RELOAD", "false").lower() == "true"
+    return templates
+
+
+templates = create_templates()
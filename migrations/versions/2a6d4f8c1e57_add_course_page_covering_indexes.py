@@ -0,0 +1,41 @@
+"""Add covering indexes for course page aggregates
+
+Revision ID: 2a6d4f8c1e57
+Revises: 5f0b93e6c7a1
+Create Date: 2026-10-17 15:02:41.283907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a6d4f8c1e57'
+down_revision: Union[str, None] = '5f0b93e6c7a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    'ix_attendances_lesson_student_attended ON attendances (lesson_id, student_id) INCLUDE (attended)',
+    'ix_task_completions_task_student_status ON task_completions (task_id, student_id) INCLUDE (status)',
+    'ix_lessons_course_id ON lessons (course_id)',
+    'ix_tasks_course_id_deadline ON tasks (course_id, deadline)',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction; avoids locking attendance/completion writes during import
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index.split()[0]}')
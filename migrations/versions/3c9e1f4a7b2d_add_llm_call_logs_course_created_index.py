@@ -0,0 +1,32 @@
+"""Add composite index on llm_call_logs (course_id, created_at)
+
+Revision ID: 3c9e1f4a7b2d
+Revises: 65656932b26f
+Create Date: 2026-10-17 10:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f4a7b2d'
+down_revision: Union[str, None] = '65656932b26f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables may already be created by SQLModel.metadata.create_all() in scripts/init_db.py
+    # CONCURRENTLY cannot run inside a transaction; keeps LLM call logging unblocked while building
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_course_created ON llm_call_logs (course_id, created_at)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_llm_course_created')
@@ -0,0 +1,38 @@
+"""Add mv_llm_active_courses materialized view
+
+Revision ID: 5f0b93e6c7a1
+Revises: e4a7c2d81b96
+Create Date: 2026-10-17 14:37:05.611820
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0b93e6c7a1'
+down_revision: Union[str, None] = 'e4a7c2d81b96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # created_at is naive UTC, so compare against UTC wall time rather than timestamptz now()
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_llm_active_courses AS
+        SELECT DISTINCT course_id FROM llm_call_logs
+        WHERE created_at >= timezone('utc', now()) - interval '24 hours'
+          AND course_id IS NOT NULL AND course_id <> ''
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_llm_active_courses_course_id ON mv_llm_active_courses (course_id)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_llm_active_courses')
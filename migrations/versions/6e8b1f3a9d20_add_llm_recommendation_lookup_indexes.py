@@ -0,0 +1,39 @@
+"""Add LLM recommendation lookup indexes
+
+Revision ID: 6e8b1f3a9d20
+Revises: 9c3e5a7d2b14
+Create Date: 2026-10-17 17:12:36.804215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e8b1f3a9d20'
+down_revision: Union[str, None] = '9c3e5a7d2b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    'ix_llm_rec_student_course_created ON llm_recommendations (student_id, course_id, created_at)',
+    'ix_llm_feedback_rec_type ON llm_feedback (recommendation_id, feedback_type)',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction; keeps feedback writes unblocked while building
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index}')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index.split()[0]}')
@@ -0,0 +1,38 @@
+"""Add llm_call_log_24h materialized view
+
+Revision ID: 8d2a6b5e0f13
+Revises: 3c9e1f4a7b2d
+Create Date: 2026-10-17 11:03:17.540129
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2a6b5e0f13'
+down_revision: Union[str, None] = '3c9e1f4a7b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # created_at is naive UTC, so compare against UTC wall time rather than timestamptz now()
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS llm_call_log_24h AS
+        SELECT * FROM llm_call_logs
+        WHERE created_at >= timezone('utc', now()) - interval '24 hours'
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_llm_call_log_24h_id ON llm_call_log_24h (id)')
+    op.execute('CREATE INDEX IF NOT EXISTS ix_llm_call_log_24h_created_at ON llm_call_log_24h (created_at)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS llm_call_log_24h')
@@ -0,0 +1,32 @@
+"""Add import_errors job_id index
+
+Revision ID: 9c3e5a7d2b14
+Revises: 2a6d4f8c1e57
+Create Date: 2026-10-17 16:21:09.457302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a7d2b14'
+down_revision: Union[str, None] = '2a6d4f8c1e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables may already be created by SQLModel.metadata.create_all() in scripts/init_db.py
+    # CONCURRENTLY cannot run inside a transaction; keeps running imports writing errors while building
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_import_errors_job_id ON import_errors (job_id)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_import_errors_job_id')
@@ -0,0 +1,31 @@
+"""Add (created_at, status) index for LLM monitoring aggregates
+
+Revision ID: b71f0c3d9e48
+Revises: 8d2a6b5e0f13
+Create Date: 2026-10-17 11:46:52.913684
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71f0c3d9e48'
+down_revision: Union[str, None] = '8d2a6b5e0f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside a transaction; keeps LLM call logging unblocked while building
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_created_status ON llm_call_logs (created_at, status)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_llm_created_status')
@@ -0,0 +1,32 @@
+"""Add covering index for LLM monitoring dashboard queries
+
+Revision ID: e4a7c2d81b96
+Revises: b71f0c3d9e48
+Create Date: 2026-10-17 14:08:31.227406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2d81b96'
+down_revision: Union[str, None] = 'b71f0c3d9e48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # INCLUDE columns let the count/avg/distinct course queries skip heap fetches
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_llm_call_log_24h_recent ON llm_call_log_24h '
+        '(created_at DESC, status) INCLUDE (response_time_ms, course_id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP INDEX IF EXISTS idx_llm_call_log_24h_recent')
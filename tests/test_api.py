@@ -82,6 +82,31 @@ class TestAdminEndpoints:
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
+    def test_admin_dashboard_not_modified(self, client):
+        """Test admin dashboard honours If-None-Match."""
+        response = client.get("/admin/")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, max-age=10, must-revalidate"
+
+        response = client.get("/admin/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_admin_dashboard_etag_tracks_counts(self, client, test_db_session):
+        """Test admin dashboard ETag changes when a student is added."""
+        import uuid
+
+        from app.models.student import Student
+
+        etag = client.get("/admin/").headers["etag"]
+
+        test_db_session.add(Student(id=f"etag_{uuid.uuid4().hex[:8]}"))
+        test_db_session.commit()
+
+        response = client.get("/admin/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
     def test_admin_users(self, client):
         """Test admin users endpoint."""
         response = client.get("/admin/users")
@@ -110,6 +135,14 @@ class TestClusterEndpoints:
         # Should return 422 for missing required parameters, which is expected behavior
         assert response.status_code == 422
 
+    def test_teacher_clustering_status(self, client):
+        """Test teacher clustering status exposes when clustering last ran."""
+        response = client.get("/api/cluster/status-teacher")
+        assert response.status_code == 200
+        data = response.json()
+        assert "statistics" in data
+        assert "last_clustering" in data
+
 
 class TestMLMonitoringEndpoints:
     """Test ML monitoring endpoints."""
@@ -123,6 +156,92 @@ class TestMLMonitoringEndpoints:
         assert isinstance(data, dict)
         assert "status" in data
 
+    def test_quality_thresholds_not_modified(self, client):
+        """Test quality thresholds honour If-None-Match."""
+        response = client.get("/api/ml-monitoring/thresholds")
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = client.get("/api/ml-monitoring/thresholds", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+class TestLLMEndpoints:
+    """Test LLM recommendation endpoints."""
+
+    def test_teacher_recommendations_page(self, client):
+        """Test teacher recommendations report the filtered total, not the page size."""
+        response = client.get("/api/llm/teacher/recommendations", params={"status": "pending", "limit": 10})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["limit"] == 10
+        assert data["has_more"] == (data["offset"] + len(data["recommendations"]) < data["total"])
+        assert isinstance(data["courses"], list)
+
+    def test_bulk_approve_unknown_recommendations(self, client):
+        """Test bulk approval when none of the recommendations exist."""
+        response = client.post(
+            "/api/llm/recommendations/bulk-approve", json=[{"recommendation_id": 999999, "is_approved": True}]
+        )
+        assert response.status_code == 404
+
+    def test_bulk_approve_requires_items(self, client):
+        """Test bulk approval rejects an empty list."""
+        response = client.post("/api/llm/recommendations/bulk-approve", json=[])
+        assert response.status_code == 400
+
+    def test_bulk_approve_saves_latest_decision(self, client, test_db_session):
+        """Test bulk approval saves one row per recommendation and updates teacher status."""
+        import json
+        import uuid
+        from datetime import datetime, timedelta
+
+        from app.models.llm_models import LLMFeedback, LLMRecommendation
+
+        student_id = f"bulk_{uuid.uuid4().hex[:8]}"
+        recs = [
+            LLMRecommendation(
+                student_id=student_id,
+                course_id=course_id,
+                cache_key=f"{student_id}_{course_id}",
+                data_version="v1",
+                recommendations_json=json.dumps(["Рекомендация"]),
+                expires_at=datetime.utcnow() + timedelta(hours=1),
+            )
+            for course_id in ("1", "2")
+        ]
+        test_db_session.add_all(recs)
+        test_db_session.commit()
+        first_id, second_id = recs[0].id, recs[1].id
+        unknown_id = second_id + 100000
+
+        response = client.post(
+            "/api/llm/recommendations/bulk-approve",
+            json=[
+                {"recommendation_id": first_id, "is_approved": True},
+                {"recommendation_id": second_id, "is_approved": True},
+                {"recommendation_id": unknown_id, "is_approved": True},
+                {"recommendation_id": first_id, "is_approved": False},
+            ],
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["saved"] == 2
+        assert data["not_found"] == [unknown_id]
+
+        feedback = (
+            test_db_session.query(LLMFeedback)
+            .filter(LLMFeedback.recommendation_id.in_([first_id, second_id]))
+            .order_by(LLMFeedback.recommendation_id)
+            .all()
+        )
+        assert [(f.recommendation_id, f.is_approved) for f in feedback] == [(first_id, False), (second_id, True)]
+
+        response = client.get("/api/llm/teacher/recommendations", params={"student": student_id})
+        statuses = {rec["id"]: rec["teacher_status"] for rec in response.json()["recommendations"]}
+        assert statuses == {first_id: "rejected", second_id: "approved"}
+
 
 class TestHomeEndpoint:
     """Test home page endpoint."""
@@ -134,6 +253,23 @@ class TestHomeEndpoint:
         assert "text/html" in response.headers["content-type"]
 
 
+class TestAuthEndpoints:
+    """Test authentication endpoints."""
+
+    def test_auth_form_redirects_to_login(self, client):
+        """Test legacy auth form is a cacheable redirect to the login page."""
+        response = client.get("/auth/verify", follow_redirects=False)
+        assert response.status_code == 307
+        assert response.headers["location"] == "/auth/login"
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_verify_empty_credentials_redirects_to_login(self, client):
+        """Test empty credentials are bounced back to the login form."""
+        response = client.post("/auth/verify", data={"login": "", "password": ""}, follow_redirects=False)
+        assert response.status_code == 303
+        assert response.headers["location"] == "/auth/login?error=empty"
+
+
 class TestErrorHandling:
     """Test error handling in endpoints."""
 
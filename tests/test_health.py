@@ -18,3 +18,10 @@ def test_health_check_content_type(client):
     response = client.get("/healthz")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/json"
+
+
+def test_health_check_rejects_other_methods(client):
+    """Test health check interceptor only answers GET."""
+    response = client.post("/healthz")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
@@ -5,6 +5,7 @@ Fixed tests for data models with isolated database sessions.
 from datetime import datetime
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from app.models.student import Course, Student, Task
 from app.models.user import Role, User
@@ -109,6 +110,19 @@ class TestUserModel:
         assert retrieved_user.display_name == "Тестовый Пользователь"
         assert retrieved_user.is_active is True
 
+    @pytest.mark.parametrize(
+        "login, email", [("unique_login", "other@example.com"), ("other_login", "unique@example.com")]
+    )
+    def test_user_login_and_email_are_unique(self, isolated_db_session, login, email):
+        """Test that duplicate logins and emails are rejected by the database."""
+        isolated_db_session.add(User(user_id="unique_user_1", login="unique_login", email="unique@example.com"))
+        isolated_db_session.commit()
+
+        isolated_db_session.add(User(user_id="unique_user_2", login=login, email=email))
+        with pytest.raises(IntegrityError):
+            isolated_db_session.commit()
+        isolated_db_session.rollback()
+
 
 class TestRoleModel:
     """Test Role model."""
@@ -4,6 +4,9 @@ Fixed tests for service classes with correct method signatures.
 
 from datetime import datetime
 
+from app.services.auth_log_service import AuthLogService
+from app.services.cache_service import TTLCache
+from app.services.config_service import ConfigService
 from app.services.metrics_service import MetricsService
 from app.services.student_service import StudentService
 from app.services.teacher_service import TeacherService
@@ -138,3 +141,85 @@ class TestMetricsService:
         course_data = progress["courses"][0]
         assert "completed_tasks" in course_data
         assert course_data["completed_tasks"] >= 1
+
+
+class TestTTLCache:
+    """Test TTLCache."""
+
+    def test_get_or_set_calls_factory_once(self):
+        """Test that cached value is reused until it expires."""
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return ["101", "102"]
+
+        assert cache.get_or_set("courses", factory) == ["101", "102"]
+        assert cache.get_or_set("courses", factory) == ["101", "102"]
+        assert len(calls) == 1
+
+    def test_expired_entry_is_dropped(self):
+        """Test that entries are not returned after TTL."""
+        cache = TTLCache(ttl_seconds=0)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
+
+    def test_invalidate(self):
+        """Test invalidating a single key and the whole cache."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.invalidate()
+        assert cache.get("b") is None
+
+
+class TestConfigService:
+    """Test ConfigService."""
+
+    def test_set_setting_overrides_cached_value(self, monkeypatch):
+        """Test that admin-set values replace cached environment values."""
+        monkeypatch.setenv("LLM_MAX_RECS", "3")
+        service = ConfigService()
+
+        assert service.get_setting("LLM_MAX_RECS", "1") == "3"
+
+        service.set_setting("LLM_MAX_RECS", "5")
+        assert service.get_settings({"LLM_MAX_RECS": "1", "LLM_REC_MAX_CHARS": "200"}) == {
+            "LLM_MAX_RECS": "5",
+            "LLM_REC_MAX_CHARS": "200",
+        }
+
+
+class TestAuthLogService:
+    """Test AuthLogService."""
+
+    def test_flush_writes_pending_entries_in_batches(self, monkeypatch):
+        """Test that flush drains the buffer in batch_size chunks."""
+        service = AuthLogService(batch_size=2, max_pending=10)
+        batches = []
+        monkeypatch.setattr(service, "_ensure_writer", lambda: None)
+        monkeypatch.setattr(service, "_write", batches.append)
+
+        for i in range(3):
+            service.record(login=f"user{i}", outcome="success")
+
+        assert service.flush() == 3
+        assert [[entry["login"] for entry in batch] for batch in batches] == [["user0", "user1"], ["user2"]]
+
+    def test_record_drops_entries_when_buffer_is_full(self, monkeypatch):
+        """Test that a full buffer never blocks the caller."""
+        service = AuthLogService(max_pending=1)
+        monkeypatch.setattr(service, "_ensure_writer", lambda: None)
+        monkeypatch.setattr(service, "_write", lambda batch: None)
+
+        service.record(login="first", outcome="success")
+        service.record(login="second", outcome="fail")
+
+        assert service.flush() == 1
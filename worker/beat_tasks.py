@@ -6,9 +6,10 @@ from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from celery import Celery
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.database.session import get_session
+from app.database.session import get_db_session, get_session
 from app.services.metrics_service import MetricsService
 from app.services.config_service import config_service
 from app.services.llm_monitoring_service import LLMMonitoringService
@@ -231,3 +232,55 @@ from sqlalchemy import and_
 # def check_llm_alerts():
 #     """Check for LLM alerts and send notifications if needed."""
 #     pass
+
+
+@celery_app.task
+def refresh_llm_call_log_24h():
+    """
+    Refresh the llm_call_log_24h materialized view.
+    Admin LLM monitoring and CSV export read from it instead of llm_call_logs.
+    """
+    logger.info("Refreshing llm_call_log_24h materialized view")
+    
+    try:
+        with get_db_session() as db:
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY llm_call_log_24h"))
+        
+        return {
+            "status": "success",
+            "timestamp": config_service.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error refreshing llm_call_log_24h: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": config_service.now().isoformat()
+        }
+
+
+@celery_app.task
+def refresh_llm_active_courses():
+    """
+    Refresh the mv_llm_active_courses materialized view.
+    Feeds the course filter dropdown on the admin LLM monitoring page.
+    """
+    logger.info("Refreshing mv_llm_active_courses materialized view")
+    
+    try:
+        with get_db_session() as db:
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_llm_active_courses"))
+        
+        return {
+            "status": "success",
+            "timestamp": config_service.now().isoformat()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error refreshing mv_llm_active_courses: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": config_service.now().isoformat()
+        }
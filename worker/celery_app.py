@@ -54,6 +54,14 @@ celery_app.conf.beat_schedule = {
         'task': 'worker.beat_tasks.update_task_statuses',
         'schedule': 180.0,  # Every 3 minutes
     },
+    'refresh-llm-call-log-24h': {
+        'task': 'worker.beat_tasks.refresh_llm_call_log_24h',
+        'schedule': 60.0,  # Every minute
+    },
+    'refresh-llm-active-courses': {
+        'task': 'worker.beat_tasks.refresh_llm_active_courses',
+        'schedule': 60.0,  # Every minute
+    },
     'daily-report': {
         'task': 'worker.beat_tasks.generate_daily_report',
         'schedule': 86400.0,  # Every 24 hours